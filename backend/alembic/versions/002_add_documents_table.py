@@ -17,13 +17,13 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     op.create_table(
         'documents',
-        sa.Column('id', sa.String(36), primary_key=True),
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_uuid_v7()')),
         sa.Column('filename', sa.String(255), nullable=False),
         sa.Column('doc_type', sa.String(20), nullable=False),
         sa.Column('file_size', sa.BigInteger(), nullable=False, default=0),
         sa.Column('chunk_count', sa.Integer(), nullable=False, default=0),
-        sa.Column('uploaded_at', sa.DateTime(), nullable=False, server_default=sa.text('NOW()')),
-        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('NOW()')),
+        sa.Column('uploaded_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('NOW()')),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('NOW()')),
     )
     op.create_index('idx_documents_uploaded_at', 'documents', ['uploaded_at'])
     op.create_index('idx_documents_doc_type', 'documents', ['doc_type'])
@@ -0,0 +1,76 @@
+"""Create secondary indexes concurrently
+
+Revision ID: 003_indexes
+Revises: 002_documents
+Create Date: 2026-08-30
+
+Secondary indexes are built here, after the tables (and any bulk load)
+exist, using CREATE INDEX CONCURRENTLY so writers are never blocked by
+ACCESS EXCLUSIVE locks. CONCURRENTLY cannot run inside a transaction,
+hence the autocommit block.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '003_indexes'
+down_revision: Union[str, None] = '002_documents'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, index definition)
+# Hot dashboard rollups get INCLUDE payload columns so aggregates are
+# satisfied by index-only scans instead of per-row heap fetches.
+# Single-column (vehicle_id) indexes on usage/cost records are omitted
+# on purpose: the composite (vehicle_id, record_date) indexes already
+# serve plain vehicle_id filters via their leading column, and every
+# extra index costs write amplification and WAL on insert-heavy tables.
+INDEXES = [
+    ('idx_vehicles_code', 'vehicles (vehicle_code)'),
+    ('idx_vehicles_depot', 'vehicles (depot)'),
+    ('idx_vehicles_status', 'vehicles (status)'),
+    ('idx_fault_vehicle', 'fault_records (vehicle_id)'),
+    ('idx_fault_date', 'fault_records (fault_date)'),
+    ('idx_fault_type', 'fault_records (fault_type)'),
+    ('idx_fault_status', 'fault_records (status)'),
+    ('idx_fault_vehicle_status_date',
+     'fault_records (vehicle_id, status, fault_date)'),
+    ('idx_maintenance_vehicle',
+     'maintenance_records (vehicle_id) INCLUDE (labor_cost, labor_hours, status)'),
+    ('idx_maintenance_date', 'maintenance_records (maintenance_date)'),
+    ('idx_maintenance_type', 'maintenance_records (maintenance_type)'),
+    ('idx_maintenance_status', 'maintenance_records (status)'),
+    ('idx_maint_vehicle_type_date',
+     'maintenance_records (vehicle_id, maintenance_type, maintenance_date)'),
+    ('idx_usage_date', 'usage_records (record_date)'),
+    ('idx_usage_vehicle_date',
+     'usage_records (vehicle_id, record_date) INCLUDE (mileage, operating_hours)'),
+    ('idx_parts_number', 'parts_inventory (part_number)'),
+    ('idx_parts_category', 'parts_inventory (category)'),
+    ('idx_parts_low_stock',
+     'parts_inventory (part_number) WHERE quantity_on_hand <= minimum_quantity'),
+    ('idx_parts_used_maintenance_part', 'parts_used (maintenance_id, part_id)'),
+    ('idx_cost_date', 'cost_records (record_date)'),
+    ('idx_cost_type', 'cost_records (cost_type)'),
+    ('idx_cost_type_date', 'cost_records (cost_type, record_date)'),
+    ('idx_cost_vehicle_date',
+     'cost_records (vehicle_id, record_date) INCLUDE (amount, cost_type)'),
+    ('idx_cost_vehicle_type_date_amount',
+     'cost_records (vehicle_id, cost_type, record_date) INCLUDE (amount)'),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, definition in INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {definition}"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _definition in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,60 @@
+"""Convert naive timestamps to TIMESTAMPTZ
+
+Revision ID: 004_timestamptz
+Revises: 003_indexes
+Create Date: 2026-08-30
+
+Existing deployments created the timestamp columns without time zone.
+TIMESTAMPTZ stores a fixed 8-byte UTC instant, so range scans over
+fault_date/maintenance_date etc. no longer need application-side tz
+arithmetic or function wrapping. Stored values are interpreted as UTC.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '004_timestamptz'
+down_revision: Union[str, None] = '003_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs created as naive TIMESTAMP in earlier revisions
+TIMESTAMP_COLUMNS = [
+    ('vehicles', 'created_at'),
+    ('vehicles', 'updated_at'),
+    ('fault_records', 'fault_date'),
+    ('fault_records', 'resolved_at'),
+    ('fault_records', 'created_at'),
+    ('fault_records', 'updated_at'),
+    ('maintenance_records', 'maintenance_date'),
+    ('maintenance_records', 'completed_date'),
+    ('maintenance_records', 'created_at'),
+    ('maintenance_records', 'updated_at'),
+    ('usage_records', 'created_at'),
+    ('usage_records', 'updated_at'),
+    ('parts_inventory', 'last_restock_date'),
+    ('parts_inventory', 'created_at'),
+    ('parts_inventory', 'updated_at'),
+    ('parts_used', 'created_at'),
+    ('cost_records', 'created_at'),
+    ('cost_records', 'updated_at'),
+    ('documents', 'uploaded_at'),
+    ('documents', 'updated_at'),
+]
+
+
+def upgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE TIMESTAMPTZ USING {column} AT TIME ZONE 'UTC'"
+        )
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE TIMESTAMP USING {column} AT TIME ZONE 'UTC'"
+        )
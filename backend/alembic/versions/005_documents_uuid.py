@@ -0,0 +1,71 @@
+"""Convert documents.id from varchar(36) to native uuid
+
+Revision ID: 005_documents_uuid
+Revises: 004_timestamptz
+Create Date: 2026-08-30
+
+Native uuid is 16 bytes and compares as two 64-bit ints, versus 37 bytes
+compared as text for the varchar form; the PK index roughly halves in
+size.
+
+gen_uuid_v7() is (re)created here before it is used as the new default:
+databases provisioned by the current revision 001 already have it, but
+deployments migrated past the original 001/002 reach this revision
+without it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '005_documents_uuid'
+down_revision: Union[str, None] = '004_timestamptz'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+GEN_UUID_V7 = """
+    CREATE OR REPLACE FUNCTION gen_uuid_v7() RETURNS uuid AS $$
+        SELECT encode(
+            set_bit(
+                set_bit(
+                    overlay(
+                        uuid_send(gen_random_uuid())
+                        PLACING substring(
+                            int8send((extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                            FROM 3
+                        )
+                        FROM 1 FOR 6
+                    ),
+                    52, 1
+                ),
+                53, 1
+            ),
+            'hex')::uuid
+    $$ LANGUAGE sql VOLATILE
+"""
+
+
+def upgrade() -> None:
+    op.execute(GEN_UUID_V7)
+    op.execute(
+        "ALTER TABLE documents ALTER COLUMN id DROP DEFAULT"
+    )
+    op.execute(
+        "ALTER TABLE documents ALTER COLUMN id TYPE uuid USING id::uuid"
+    )
+    op.execute(
+        "ALTER TABLE documents ALTER COLUMN id SET DEFAULT gen_uuid_v7()"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE documents ALTER COLUMN id DROP DEFAULT"
+    )
+    op.execute(
+        "ALTER TABLE documents ALTER COLUMN id TYPE varchar(36) USING id::text"
+    )
+    op.execute(
+        "ALTER TABLE documents ALTER COLUMN id SET DEFAULT gen_uuid_v7()::text"
+    )
@@ -0,0 +1,108 @@
+"""Partition history tables by date range
+
+Revision ID: 006_partition_history
+Revises: 005_documents_uuid
+Create Date: 2026-08-30
+
+fault_records, usage_records and cost_records grow monotonically and
+every dashboard query filters on a date range, so they become
+PARTITION BY RANGE tables with monthly partitions. The planner then
+prunes cold months and autovacuum/index maintenance stays bounded per
+partition. maintenance_records is left unpartitioned: parts_used holds a
+foreign key to maintenance_records(id), and a partitioned parent cannot
+carry a unique constraint that excludes the partition key.
+
+New monthly partitions must be created ahead of time (pg_partman or a
+monthly job issuing CREATE TABLE ... PARTITION OF ...); rows outside the
+pre-created range land in the DEFAULT partition.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '006_partition_history'
+down_revision: Union[str, None] = '005_documents_uuid'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, partition key, indexes to recreate on the parent)
+PARTITIONED_TABLES = [
+    ('fault_records', 'fault_date', [
+        ('idx_fault_vehicle', '(vehicle_id)'),
+        ('idx_fault_date', '(fault_date)'),
+        ('idx_fault_type', '(fault_type)'),
+        ('idx_fault_status', '(status)'),
+        ('idx_fault_vehicle_status_date', '(vehicle_id, status, fault_date)'),
+    ]),
+    ('usage_records', 'record_date', [
+        ('idx_usage_date', '(record_date)'),
+        ('idx_usage_vehicle_date',
+         '(vehicle_id, record_date) INCLUDE (mileage, operating_hours)'),
+    ]),
+    ('cost_records', 'record_date', [
+        ('idx_cost_date', '(record_date)'),
+        ('idx_cost_type', '(cost_type)'),
+        ('idx_cost_type_date', '(cost_type, record_date)'),
+        ('idx_cost_vehicle_date',
+         '(vehicle_id, record_date) INCLUDE (amount, cost_type)'),
+        ('idx_cost_vehicle_type_date_amount',
+         '(vehicle_id, cost_type, record_date) INCLUDE (amount)'),
+    ]),
+]
+
+# Pre-created monthly ranges; extend via the partition-maintenance job
+MONTHS = [(2026, m) for m in range(1, 13)] + [(2027, 1)]
+
+
+def _month_bounds(year: int, month: int) -> tuple[str, str]:
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return f"{year:04d}-{month:02d}-01", f"{next_year:04d}-{next_month:02d}-01"
+
+
+def upgrade() -> None:
+    for table, key, indexes in PARTITIONED_TABLES:
+        op.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+        op.execute(
+            f"CREATE TABLE {table} (LIKE {table}_legacy INCLUDING DEFAULTS) "
+            f"PARTITION BY RANGE ({key})"
+        )
+        op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id, {key})")
+        op.execute(
+            f"ALTER TABLE {table} ADD FOREIGN KEY (vehicle_id) "
+            f"REFERENCES vehicles(id) ON DELETE CASCADE"
+        )
+
+        for year, month in MONTHS[:-1]:
+            start, end = _month_bounds(year, month)
+            op.execute(
+                f"CREATE TABLE {table}_{year:04d}_{month:02d} "
+                f"PARTITION OF {table} "
+                f"FOR VALUES FROM ('{start}') TO ('{end}')"
+            )
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+        # Parent-level indexes cascade to all partitions
+        for name, definition in indexes:
+            op.execute(f"DROP INDEX IF EXISTS {name}")
+            op.execute(f"CREATE INDEX {name} ON {table} {definition}")
+
+        op.execute(f"INSERT INTO {table} SELECT * FROM {table}_legacy")
+        op.execute(f"DROP TABLE {table}_legacy")
+
+
+def downgrade() -> None:
+    for table, key, indexes in PARTITIONED_TABLES:
+        op.execute(f"ALTER TABLE {table} RENAME TO {table}_partitioned")
+        op.execute(
+            f"CREATE TABLE {table} "
+            f"(LIKE {table}_partitioned INCLUDING DEFAULTS INCLUDING INDEXES)"
+        )
+        op.execute(f"INSERT INTO {table} SELECT * FROM {table}_partitioned")
+        op.execute(f"DROP TABLE {table}_partitioned")
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT {table}_pkey")
+        op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id)")
+        op.execute(
+            f"ALTER TABLE {table} ADD FOREIGN KEY (vehicle_id) "
+            f"REFERENCES vehicles(id) ON DELETE CASCADE"
+        )
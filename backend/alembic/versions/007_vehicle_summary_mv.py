@@ -0,0 +1,50 @@
+"""Add vehicle_summary materialized view
+
+Revision ID: 007_vehicle_summary
+Revises: 006_partition_history
+Create Date: 2026-08-30
+
+Dashboard rollups (fault counts, year-to-date cost per vehicle) are
+O(history rows) when computed live. The materialized view makes them
+O(vehicles); the unique index on id allows REFRESH MATERIALIZED VIEW
+CONCURRENTLY so readers are never blocked. The dashboard service reads
+the view for the vehicle fault ranking and refreshes it from an
+app-level background task every 5 minutes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '007_vehicle_summary'
+down_revision: Union[str, None] = '006_partition_history'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE MATERIALIZED VIEW vehicle_summary AS
+        SELECT
+            v.id,
+            v.vehicle_code,
+            v.vehicle_type,
+            COUNT(DISTINCT f.id) FILTER (WHERE f.status = 'open') AS open_faults,
+            COUNT(DISTINCT f.id) FILTER (
+                WHERE f.fault_date >= now() - interval '90 days'
+            ) AS faults_90d,
+            COUNT(DISTINCT f.id) AS total_faults,
+            COALESCE(SUM(c.amount), 0) AS ytd_cost
+        FROM vehicles v
+        LEFT JOIN fault_records f ON f.vehicle_id = v.id
+        LEFT JOIN cost_records c ON c.vehicle_id = v.id
+            AND c.record_date >= date_trunc('year', now())
+        GROUP BY v.id, v.vehicle_code, v.vehicle_type
+    """)
+    op.execute(
+        "CREATE UNIQUE INDEX idx_vehicle_summary_id ON vehicle_summary (id)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS vehicle_summary")
@@ -0,0 +1,50 @@
+"""Add CHECK constraints on enum-like status columns
+
+Revision ID: 008_status_checks
+Revises: 007_vehicle_summary
+Create Date: 2026-08-30
+
+The status/severity/type columns are free-form String(20/50) holding a
+small closed set of values. CHECK constraints give the planner accurate
+selectivity on those columns and reject bad values at the database
+instead of relying on app-side validation.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '008_status_checks'
+down_revision: Union[str, None] = '007_vehicle_summary'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (constraint name, table, column, allowed values)
+CHECKS = [
+    ('chk_vehicles_status', 'vehicles', 'status',
+     ('active', 'maintenance', 'retired')),
+    ('chk_fault_severity', 'fault_records', 'severity',
+     ('critical', 'major', 'minor')),
+    ('chk_fault_status', 'fault_records', 'status',
+     ('open', 'in_progress', 'resolved')),
+    ('chk_maintenance_type', 'maintenance_records', 'maintenance_type',
+     ('scheduled', 'unscheduled', 'emergency')),
+    ('chk_maintenance_status', 'maintenance_records', 'status',
+     ('pending', 'in_progress', 'completed')),
+    ('chk_cost_type', 'cost_records', 'cost_type',
+     ('labor', 'parts', 'external', 'other')),
+]
+
+
+def upgrade() -> None:
+    for name, table, column, values in CHECKS:
+        value_list = ", ".join(f"'{v}'" for v in values)
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {name} "
+            f"CHECK ({column} IN ({value_list}))"
+        )
+
+
+def downgrade() -> None:
+    for name, table, _column, _values in CHECKS:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {name}")
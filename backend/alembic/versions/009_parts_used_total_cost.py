@@ -0,0 +1,33 @@
+"""Make parts_used.total_cost a stored generated column
+
+Revision ID: 009_total_cost
+Revises: 008_status_checks
+Create Date: 2026-08-30
+
+total_cost was application-maintained and could drift from
+quantity * unit_cost; as a STORED generated column the database keeps it
+consistent and list endpoints never recompute it in Python.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '009_total_cost'
+down_revision: Union[str, None] = '008_status_checks'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE parts_used DROP COLUMN total_cost")
+    op.execute(
+        "ALTER TABLE parts_used ADD COLUMN total_cost numeric(12, 2) "
+        "GENERATED ALWAYS AS (quantity * unit_cost) STORED"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE parts_used DROP COLUMN total_cost")
+    op.execute("ALTER TABLE parts_used ADD COLUMN total_cost numeric(12, 2)")
+    op.execute("UPDATE parts_used SET total_cost = quantity * unit_cost")
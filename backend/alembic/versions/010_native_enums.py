@@ -0,0 +1,63 @@
+"""Convert enum-like string columns to native PG ENUM types
+
+Revision ID: 010_native_enums
+Revises: 009_total_cost
+Create Date: 2026-08-30
+
+Native ENUM values store as 4-byte OIDs instead of varchar header plus
+payload, shrinking rows and the status/type indexes and giving the
+planner cheap equality checks. The CHECK constraints from
+008_status_checks become redundant and are dropped here; the enum type
+itself now rejects bad values.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '010_native_enums'
+down_revision: Union[str, None] = '009_total_cost'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (enum type name, values, table, column, old type, CHECK to drop)
+ENUM_COLUMNS = [
+    ('vehicle_status', ('active', 'maintenance', 'retired'),
+     'vehicles', 'status', 'varchar(20)', 'chk_vehicles_status'),
+    ('fault_severity', ('critical', 'major', 'minor'),
+     'fault_records', 'severity', 'varchar(20)', 'chk_fault_severity'),
+    ('fault_status', ('open', 'in_progress', 'resolved'),
+     'fault_records', 'status', 'varchar(20)', 'chk_fault_status'),
+    ('maintenance_type', ('scheduled', 'unscheduled', 'emergency'),
+     'maintenance_records', 'maintenance_type', 'varchar(50)',
+     'chk_maintenance_type'),
+    ('maintenance_status', ('pending', 'in_progress', 'completed'),
+     'maintenance_records', 'status', 'varchar(20)', 'chk_maintenance_status'),
+    ('cost_type', ('labor', 'parts', 'external', 'other'),
+     'cost_records', 'cost_type', 'varchar(50)', 'chk_cost_type'),
+]
+
+
+def upgrade() -> None:
+    for type_name, values, table, column, _old_type, check in ENUM_COLUMNS:
+        value_list = ", ".join(f"'{v}'" for v in values)
+        op.execute(f"CREATE TYPE {type_name} AS ENUM ({value_list})")
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {check}")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {type_name} USING {column}::{type_name}"
+        )
+
+
+def downgrade() -> None:
+    for type_name, values, table, column, old_type, check in ENUM_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {old_type} USING {column}::text"
+        )
+        value_list = ", ".join(f"'{v}'" for v in values)
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {check} "
+            f"CHECK ({column} IN ({value_list}))"
+        )
+        op.execute(f"DROP TYPE {type_name}")
@@ -0,0 +1,41 @@
+"""Add generated is_low_stock column to parts_inventory
+
+Revision ID: 011_low_stock
+Revises: 010_native_enums
+Create Date: 2026-08-30
+
+is_low_stock was a Python @property, so "find all low-stock parts"
+had to load every row to evaluate it. As a STORED generated column with
+a partial index over the true rows, the alert query becomes an index
+scan over restock candidates only.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '011_low_stock'
+down_revision: Union[str, None] = '010_native_enums'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE parts_inventory ADD COLUMN is_low_stock boolean "
+        "GENERATED ALWAYS AS (quantity_on_hand <= minimum_quantity) STORED"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_parts_low_stock")
+    op.execute(
+        "CREATE INDEX idx_parts_low_stock ON parts_inventory (part_number) "
+        "WHERE is_low_stock"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_parts_low_stock")
+    op.execute("ALTER TABLE parts_inventory DROP COLUMN is_low_stock")
+    op.execute(
+        "CREATE INDEX idx_parts_low_stock ON parts_inventory (part_number) "
+        "WHERE quantity_on_hand <= minimum_quantity"
+    )
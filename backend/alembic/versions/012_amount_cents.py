@@ -0,0 +1,65 @@
+"""Store cost_records.amount as bigint cents
+
+Revision ID: 012_amount_cents
+Revises: 011_low_stock
+Create Date: 2026-08-30
+
+numeric is variable-width and substantially slower to aggregate than
+bigint; dashboard SUM/AVG over cost_records is the hottest aggregate in
+the app. Amounts are TWD with two decimal places, so bigint cents loses
+nothing. vehicle_summary depends on the column and PG refuses ALTER TYPE
+under a dependent view, so the view is rebuilt around the change with
+its ytd_cost converted back to dollars.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '012_amount_cents'
+down_revision: Union[str, None] = '011_low_stock'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VEHICLE_SUMMARY = """
+    CREATE MATERIALIZED VIEW vehicle_summary AS
+    SELECT
+        v.id,
+        v.vehicle_code,
+        v.vehicle_type,
+        COUNT(DISTINCT f.id) FILTER (WHERE f.status = 'open') AS open_faults,
+        COUNT(DISTINCT f.id) FILTER (
+            WHERE f.fault_date >= now() - interval '90 days'
+        ) AS faults_90d,
+        COUNT(DISTINCT f.id) AS total_faults,
+        COALESCE(SUM(c.amount), 0) / 100.0 AS ytd_cost
+    FROM vehicles v
+    LEFT JOIN fault_records f ON f.vehicle_id = v.id
+    LEFT JOIN cost_records c ON c.vehicle_id = v.id
+        AND c.record_date >= date_trunc('year', now())
+    GROUP BY v.id, v.vehicle_code, v.vehicle_type
+"""
+
+
+def upgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS vehicle_summary")
+    op.execute(
+        "ALTER TABLE cost_records ALTER COLUMN amount "
+        "TYPE bigint USING round(amount * 100)::bigint"
+    )
+    op.execute(VEHICLE_SUMMARY)
+    op.execute(
+        "CREATE UNIQUE INDEX idx_vehicle_summary_id ON vehicle_summary (id)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS vehicle_summary")
+    op.execute(
+        "ALTER TABLE cost_records ALTER COLUMN amount "
+        "TYPE numeric(14, 2) USING amount / 100.0"
+    )
+    op.execute(VEHICLE_SUMMARY.replace("/ 100.0 AS ytd_cost", "AS ytd_cost"))
+    op.execute(
+        "CREATE UNIQUE INDEX idx_vehicle_summary_id ON vehicle_summary (id)"
+    )
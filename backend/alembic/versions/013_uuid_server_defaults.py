@@ -0,0 +1,69 @@
+"""Backfill gen_uuid_v7() and id server defaults on existing databases
+
+Revision ID: 013_uuid_defaults
+Revises: 012_amount_cents
+Create Date: 2026-08-30
+
+The gen_uuid_v7() function and the id server defaults on the structured
+tables are created by the current revision 001, which only runs on
+databases provisioned from scratch. Deployments migrated past the
+original 001/002 never re-run it, so they have neither the function nor
+the defaults. Recreate both here; CREATE OR REPLACE keeps this a no-op
+on freshly provisioned databases.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '013_uuid_defaults'
+down_revision: Union[str, None] = '012_amount_cents'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STRUCTURED_TABLES = (
+    'vehicles',
+    'fault_records',
+    'maintenance_records',
+    'usage_records',
+    'parts_inventory',
+    'parts_used',
+    'cost_records',
+)
+
+GEN_UUID_V7 = """
+    CREATE OR REPLACE FUNCTION gen_uuid_v7() RETURNS uuid AS $$
+        SELECT encode(
+            set_bit(
+                set_bit(
+                    overlay(
+                        uuid_send(gen_random_uuid())
+                        PLACING substring(
+                            int8send((extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                            FROM 3
+                        )
+                        FROM 1 FOR 6
+                    ),
+                    52, 1
+                ),
+                53, 1
+            ),
+            'hex')::uuid
+    $$ LANGUAGE sql VOLATILE
+"""
+
+
+def upgrade() -> None:
+    op.execute(GEN_UUID_V7)
+    for table in STRUCTURED_TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_uuid_v7()"
+        )
+
+
+def downgrade() -> None:
+    # Pre-013 databases carried no server default on these id columns
+    # (ids came from the ORM's client-side default); the function itself
+    # is left in place since revision 001 owns it on fresh databases.
+    for table in STRUCTURED_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
@@ -1,7 +1,6 @@
 """Application configuration."""
 import os
-from pydantic_settings import BaseSettings
-from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -19,11 +18,19 @@ class Settings(BaseSettings):
     qdrant_collection_name: str = "knowledge_base"
     qdrant_url: str = "http://localhost:6333"
     qdrant_api_key: str = ""
+    # True when Qdrant can read the backup directory directly (same host
+    # or shared volume); restore then recovers from the file path instead
+    # of re-uploading the snapshot over HTTP
+    qdrant_snapshots_shared: bool = False
 
     # Redis
     redis_url: str = "redis://localhost:6379"
     cache_ttl: int = 3600  # 1 hour default
 
+    # RAG
+    # Skip the LLM call entirely when retrieval returns no sources
+    empty_sources_short_circuit: bool = True
+
     # Cohere Reranker
     cohere_api_key: str = ""
     cohere_model: str = "rerank-v3.5"
@@ -47,12 +54,14 @@ class Settings(BaseSettings):
     # Document Storage (for original file preview)
     storage_dir: str = "./storage/documents"
 
-    class Config:
-        env_file = ".env"
-        extra = "ignore"
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore", frozen=True)
+
+
+# Settings are static post-boot; a module-level singleton avoids the
+# lru_cache lock and dict probe on every get_settings() call.
+SETTINGS = Settings()
 
 
-@lru_cache()
 def get_settings() -> Settings:
-    """Get cached settings."""
-    return Settings()
+    """Get the settings singleton (kept for Depends(get_settings))."""
+    return SETTINGS
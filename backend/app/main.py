@@ -1,13 +1,29 @@
 """AI KM Platform - Multimodal RAG Backend."""
+import asyncio
+import hmac
+import importlib
 import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
-from app.routers import kb, chat, upload_ws, structured, query, export, dashboard
 from app.config import get_settings
 
+# Routers and their mount prefixes, registered via importlib below so each
+# router module (and its service imports) loads one at a time rather than
+# all through a single top-level import statement.
+ROUTERS = [
+    ("kb", ""),
+    ("chat", ""),
+    ("upload_ws", ""),
+    ("structured", "/api"),
+    ("query", "/api"),
+    ("export", "/api"),
+    ("dashboard", "/api"),
+]
+
 # API Key for authentication
 API_KEY = os.getenv("AIKM_API_KEY", "")
 
@@ -21,24 +37,28 @@ ALLOWED_ORIGINS = [
 
 class APIKeyMiddleware(BaseHTTPMiddleware):
     """Middleware to verify API key for protected endpoints."""
-    
-    # Endpoints that don't require API key
-    PUBLIC_PATHS = ["/", "/health", "/docs", "/openapi.json", "/redoc"]
-    
+
+    # Endpoints that don't require API key (frozenset for O(1) lookup)
+    PUBLIC_PATHS = frozenset({"/", "/health", "/docs", "/openapi.json", "/redoc"})
+
     async def dispatch(self, request: Request, call_next):
+        # CORS preflights carry no credentials; never 401 them
+        if request.method == "OPTIONS":
+            return await call_next(request)
+
         # Skip API key check for public paths
         if request.url.path in self.PUBLIC_PATHS:
             return await call_next(request)
-        
+
         # Skip if no API key is configured (development mode)
         if not API_KEY:
             return await call_next(request)
-        
-        # Check API key in header
+
+        # Constant-time compare avoids leaking key bytes via timing
         request_api_key = request.headers.get("X-API-Key")
-        if request_api_key != API_KEY:
+        if not hmac.compare_digest(request_api_key or "", API_KEY):
             raise HTTPException(status_code=401, detail="Invalid or missing API key")
-        
+
         return await call_next(request)
 
 
@@ -56,15 +76,33 @@ async def lifespan(app: FastAPI):
     
     # Startup: Initialize database (structured data)
     try:
-        from app.db.session import init_db
+        from app.db.session import init_db, warm_pool
         await init_db()
+        await warm_pool()
         print("✅ PostgreSQL database initialized")
     except Exception as e:
         print(f"⚠️ PostgreSQL not available: {e}")
 
+    # Startup: build the query-path singletons (OpenAI clients, prompt
+    # templates) so the first /query request doesn't pay construction cost
+    from app.services.intent_classifier import get_intent_classifier
+    from app.services.nl2sql_service import get_nl2sql_service
+    get_intent_classifier()
+    get_nl2sql_service()
+
+    # Startup: keep the vehicle_summary materialized view (dashboard
+    # fault ranking) refreshed in the background
+    from app.services.dashboard_service import refresh_vehicle_summary_loop
+    summary_refresh = asyncio.create_task(refresh_vehicle_summary_loop())
+
     yield
 
     # Shutdown
+    summary_refresh.cancel()
+    try:
+        await summary_refresh
+    except asyncio.CancelledError:
+        pass
     try:
         from app.db.session import close_db
         await close_db()
@@ -79,28 +117,28 @@ app = FastAPI(
     description="Multimodal RAG Knowledge Management Platform",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# API Key middleware (must be added before CORS)
+# API Key middleware (added first so CORS, added after, runs outermost
+# and answers preflights before the auth check)
 app.add_middleware(APIKeyMiddleware)
 
-# CORS configuration - restrict to allowed origins
+# CORS configuration - restrict to allowed origins. Methods and headers
+# are enumerated so Starlette serves preflights from a precomputed
+# static response instead of echoing the request headers back.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*", "X-API-Key"],  # Allow API key header
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+    allow_headers=["Content-Type", "Authorization", "X-API-Key"],
 )
 
 # Include routers
-app.include_router(kb.router)
-app.include_router(chat.router)
-app.include_router(upload_ws.router)
-app.include_router(structured.router, prefix="/api")
-app.include_router(query.router, prefix="/api")
-app.include_router(export.router, prefix="/api")
-app.include_router(dashboard.router, prefix="/api")
+for _name, _prefix in ROUTERS:
+    _module = importlib.import_module(f"app.routers.{_name}")
+    app.include_router(_module.router, prefix=_prefix)
 
 
 @app.get("/")
@@ -122,4 +160,11 @@ async def health():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        loop="uvloop",
+        http="httptools",
+    )
@@ -1,7 +1,9 @@
 """Document model for persistent document metadata storage."""
 
+import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, BigInteger, Integer, DateTime
+from sqlalchemy import Column, String, BigInteger, Integer, DateTime, text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 
 from app.db import Base
@@ -9,21 +11,27 @@ from app.db import Base
 
 class Document(Base):
     """SQLAlchemy model for document metadata."""
-    
+
     __tablename__ = "documents"
-    
-    id = Column(String(36), primary_key=True)
+
+    # Native 16-byte uuid with server-side UUIDv7 for insert locality
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        server_default=text("gen_uuid_v7()"),
+    )
     filename = Column(String(255), nullable=False)
     doc_type = Column(String(20), nullable=False)
     file_size = Column(BigInteger, nullable=False, default=0)
     chunk_count = Column(Integer, nullable=False, default=0)
-    uploaded_at = Column(DateTime, nullable=False, server_default=func.now())
-    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+    uploaded_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     
     def to_dict(self) -> dict:
         """Convert model to dictionary."""
         return {
-            "id": self.id,
+            "id": str(self.id),
             "filename": self.filename,
             "doc_type": self.doc_type,
             "file_size": self.file_size,
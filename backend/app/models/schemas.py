@@ -1,6 +1,6 @@
 """Pydantic schemas for API requests and responses."""
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Literal, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -38,6 +38,16 @@ class ProcessingStep(str, Enum):
     DONE = "done"
 
 
+# Literal aliases for hot-path fields: pydantic-core's literal validator
+# is a plain string match, cheaper than Enum membership + coercion. The
+# Enum classes above remain the canonical value sets.
+ChunkTypeLit = Literal["text", "image"]
+TaskStatusLit = Literal["pending", "processing", "completed", "failed", "cancelled"]
+ProcessingStepLit = Literal[
+    "uploading", "parsing", "chunking", "embedding", "indexing", "done"
+]
+
+
 class BackupStatus(str, Enum):
     """Backup status enum."""
     PENDING = "pending"
@@ -63,6 +73,8 @@ class SearchRequest(BaseModel):
 # Response schemas
 class DocumentInfo(BaseModel):
     """Document information."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     filename: str
     doc_type: DocumentType
@@ -88,17 +100,29 @@ class UploadResponse(BaseModel):
 
 
 class SearchResult(BaseModel):
-    """Single search result."""
+    """Single search result.
+
+    Instantiated once per retrieval hit, so the model is frozen with
+    extras forbidden: pydantic skips mutability bookkeeping and fails
+    fast on unexpected keys instead of silently storing them.
+    """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     content: str
-    doc_type: ChunkType
+    doc_type: ChunkTypeLit
     document_id: str
     document_name: str
     score: float
+    # Deprecated on the wire: responses strip this and clients should load
+    # the image from image_url instead. Kept internally for multimodal
+    # LLM prompting.
     image_base64: Optional[str] = None
+    image_url: Optional[str] = None
     file_url: Optional[str] = None
 
 
+
 class ChatResponse(BaseModel):
     """Chat response."""
     answer: str
@@ -141,8 +165,8 @@ class ProcessingTask(BaseModel):
     document_id: str
     filename: str
     file_size: int
-    status: TaskStatus = TaskStatus.PENDING
-    step: ProcessingStep = ProcessingStep.UPLOADING
+    status: TaskStatusLit = "pending"
+    step: ProcessingStepLit = "uploading"
     progress: int = Field(ge=0, le=100, default=0)
     chunk_count: int = 0
     message: Optional[str] = None
@@ -173,10 +197,12 @@ class BackupListResponse(BaseModel):
 
 
 class ProgressMessage(BaseModel):
-    """WebSocket progress message."""
+    """WebSocket progress message (one per progress tick, hence frozen)."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     task_id: str
-    status: TaskStatus
-    step: ProcessingStep
+    status: TaskStatusLit
+    step: ProcessingStepLit
     progress: int = Field(ge=0, le=100)
     message: str
     chunk_count: int = 0
@@ -185,6 +211,8 @@ class ProgressMessage(BaseModel):
 
 class CacheStats(BaseModel):
     """Cache statistics."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     total_keys: int
     query_cache_count: int
     task_cache_count: int
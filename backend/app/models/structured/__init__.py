@@ -1,16 +1,31 @@
 """
 Structured data models for vehicle maintenance system.
+
+Models are exposed lazily via module __getattr__ (PEP 562): importing
+this package no longer configures six SQLAlchemy mappers up front, and
+`from app.models.structured import Vehicle` pulls in only the module
+that defines the requested name, on first use.
 """
 
-from .vehicle import Vehicle
-from .fault_record import FaultRecord
-from .maintenance import MaintenanceRecord
-from .usage import UsageRecord
-from .parts import PartsUsed, PartsInventory
-from .cost import CostRecord
+import importlib
+
+# Exported name -> defining submodule
+_MODULES = {
+    "Vehicle": ".vehicle",
+    "VehicleLite": ".vehicle",
+    "select_vehicles_lite": ".vehicle",
+    "FaultRecord": ".fault_record",
+    "MaintenanceRecord": ".maintenance",
+    "UsageRecord": ".usage",
+    "PartsUsed": ".parts",
+    "PartsInventory": ".parts",
+    "CostRecord": ".cost",
+}
 
 __all__ = [
     "Vehicle",
+    "VehicleLite",
+    "select_vehicles_lite",
     "FaultRecord",
     "MaintenanceRecord",
     "UsageRecord",
@@ -18,3 +33,13 @@ __all__ = [
     "PartsInventory",
     "CostRecord",
 ]
+
+
+def __getattr__(name: str):
+    try:
+        module = importlib.import_module(_MODULES[name], __name__)
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    return getattr(module, name)
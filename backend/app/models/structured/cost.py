@@ -4,10 +4,11 @@ CostRecord model - 維修成本
 
 from datetime import datetime, date
 from typing import Optional, TYPE_CHECKING
-from uuid import uuid4, UUID as PyUUID
+from uuid import UUID as PyUUID, uuid4
 
-from sqlalchemy import String, Numeric, Date, DateTime, ForeignKey, Index
+from sqlalchemy import BigInteger, Enum, String, Numeric, Date, DateTime, ForeignKey, Index, text, func
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db import Base
@@ -21,10 +22,11 @@ class CostRecord(Base):
     
     __tablename__ = "cost_records"
 
-    id: Mapped[UUID] = mapped_column(
+    id: Mapped[PyUUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4
+        default=uuid4,
+        server_default=text("gen_uuid_v7()")
     )
     vehicle_id: Mapped[PyUUID] = mapped_column(
         UUID(as_uuid=True),
@@ -39,7 +41,7 @@ class CostRecord(Base):
         comment="記錄日期"
     )
     cost_type: Mapped[str] = mapped_column(
-        String(50),
+        Enum("labor", "parts", "external", "other", name="cost_type"),
         nullable=False,
         index=True,
         comment="成本類型: labor/parts/external/other"
@@ -54,10 +56,10 @@ class CostRecord(Base):
         nullable=True,
         comment="費用說明"
     )
-    amount: Mapped[float] = mapped_column(
-        Numeric(14, 2),
+    amount: Mapped[int] = mapped_column(
+        BigInteger,
         nullable=False,
-        comment="金額"
+        comment="金額 (以分儲存)"
     )
     currency: Mapped[str] = mapped_column(
         String(10),
@@ -86,24 +88,39 @@ class CostRecord(Base):
         comment="核准人"
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow
+        server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow
+        server_default=func.now(),
+        onupdate=func.now()
     )
 
     # Relationships
-    vehicle: Mapped["Vehicle"] = relationship(back_populates="cost_records")
+    vehicle: Mapped["Vehicle"] = relationship(
+        lazy="raise",
+        viewonly=True
+    )
 
     __table_args__ = (
         Index("idx_cost_type_date", "cost_type", "record_date"),
         Index("idx_cost_vehicle_date", "vehicle_id", "record_date"),
+        # Covers per-vehicle cost breakdowns: the INCLUDE'd amount lets
+        # SUM(amount) run as an index-only scan without heap fetches
+        Index(
+            "idx_cost_vehicle_type_date_amount",
+            "vehicle_id", "cost_type", "record_date",
+            postgresql_include=["amount"],
+        ),
     )
 
+    @hybrid_property
+    def amount_decimal(self) -> float:
+        """金額 (元)"""
+        return self.amount / 100
+
     def __repr__(self) -> str:
         return f"<CostRecord(type={self.cost_type}, amount={self.amount})>"
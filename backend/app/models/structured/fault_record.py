@@ -4,9 +4,9 @@ FaultRecord model - 故障歷程
 
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from uuid import uuid4, UUID as PyUUID
+from uuid import UUID as PyUUID, uuid4
 
-from sqlalchemy import String, Text, DateTime, ForeignKey, Index
+from sqlalchemy import Enum, String, Text, DateTime, ForeignKey, Index, text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -21,10 +21,11 @@ class FaultRecord(Base):
     
     __tablename__ = "fault_records"
 
-    id: Mapped[UUID] = mapped_column(
+    id: Mapped[PyUUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4
+        default=uuid4,
+        server_default=text("gen_uuid_v7()")
     )
     vehicle_id: Mapped[PyUUID] = mapped_column(
         UUID(as_uuid=True),
@@ -38,7 +39,7 @@ class FaultRecord(Base):
         comment="故障編號"
     )
     fault_date: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
         index=True,
         comment="故障發生時間"
@@ -50,12 +51,12 @@ class FaultRecord(Base):
         comment="故障類型 (如 轉向架、煞車、電氣)"
     )
     severity: Mapped[str] = mapped_column(
-        String(20),
+        Enum("critical", "major", "minor", name="fault_severity"),
         nullable=False,
         comment="嚴重程度: critical/major/minor"
     )
     status: Mapped[str] = mapped_column(
-        String(20),
+        Enum("open", "in_progress", "resolved", name="fault_status"),
         nullable=False,
         default="open",
         comment="處理狀態: open/in_progress/resolved"
@@ -63,15 +64,19 @@ class FaultRecord(Base):
     description: Mapped[Optional[str]] = mapped_column(
         Text,
         nullable=True,
+        deferred=True,
+        deferred_group="narrative",
         comment="故障描述"
     )
     resolution: Mapped[Optional[str]] = mapped_column(
         Text,
         nullable=True,
+        deferred=True,
+        deferred_group="narrative",
         comment="處理方式"
     )
     resolved_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=True,
         comment="解決時間"
     )
@@ -81,22 +86,27 @@ class FaultRecord(Base):
         comment="回報人員"
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow
+        server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow
+        server_default=func.now(),
+        onupdate=func.now()
     )
 
     # Relationships
-    vehicle: Mapped["Vehicle"] = relationship(back_populates="fault_records")
+    vehicle: Mapped["Vehicle"] = relationship(
+        lazy="raise",
+        viewonly=True
+    )
 
     __table_args__ = (
         Index("idx_fault_status", "status"),
+        # Dashboard fault lists filter by (vehicle, status) over a date range
+        Index("idx_fault_vehicle_status_date", "vehicle_id", "status", "fault_date"),
     )
 
     def __repr__(self) -> str:
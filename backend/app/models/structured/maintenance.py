@@ -4,9 +4,9 @@ MaintenanceRecord model - 檢修歷程
 
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from uuid import uuid4, UUID as PyUUID
+from uuid import UUID as PyUUID, uuid4
 
-from sqlalchemy import String, Text, DateTime, Numeric, ForeignKey, Index
+from sqlalchemy import Enum, String, Text, DateTime, Numeric, ForeignKey, Index, text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -22,10 +22,11 @@ class MaintenanceRecord(Base):
     
     __tablename__ = "maintenance_records"
 
-    id: Mapped[UUID] = mapped_column(
+    id: Mapped[PyUUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4
+        default=uuid4,
+        server_default=text("gen_uuid_v7()")
     )
     vehicle_id: Mapped[PyUUID] = mapped_column(
         UUID(as_uuid=True),
@@ -39,24 +40,24 @@ class MaintenanceRecord(Base):
         comment="檢修編號"
     )
     maintenance_type: Mapped[str] = mapped_column(
-        String(50),
+        Enum("scheduled", "unscheduled", "emergency", name="maintenance_type"),
         nullable=False,
         index=True,
         comment="檢修類型: scheduled/unscheduled/emergency"
     )
     maintenance_date: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
         index=True,
         comment="檢修日期"
     )
     completed_date: Mapped[Optional[datetime]] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=True,
         comment="完成日期"
     )
     status: Mapped[str] = mapped_column(
-        String(20),
+        Enum("pending", "in_progress", "completed", name="maintenance_status"),
         nullable=False,
         default="pending",
         comment="狀態: pending/in_progress/completed"
@@ -64,11 +65,15 @@ class MaintenanceRecord(Base):
     description: Mapped[Optional[str]] = mapped_column(
         Text,
         nullable=True,
+        deferred=True,
+        deferred_group="narrative",
         comment="檢修描述"
     )
     work_performed: Mapped[Optional[str]] = mapped_column(
         Text,
         nullable=True,
+        deferred=True,
+        deferred_group="narrative",
         comment="執行工作內容"
     )
     labor_hours: Mapped[Optional[float]] = mapped_column(
@@ -92,26 +97,33 @@ class MaintenanceRecord(Base):
         comment="督導"
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow
+        server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow
+        server_default=func.now(),
+        onupdate=func.now()
     )
 
     # Relationships
-    vehicle: Mapped["Vehicle"] = relationship(back_populates="maintenance_records")
+    vehicle: Mapped["Vehicle"] = relationship(
+        lazy="raise",
+        viewonly=True
+    )
     parts_used: Mapped[list["PartsUsed"]] = relationship(
-        back_populates="maintenance_record",
-        lazy="selectin"
+        lazy="raise",
+        viewonly=True
     )
 
     __table_args__ = (
         Index("idx_maintenance_status", "status"),
+        Index(
+            "idx_maint_vehicle_type_date",
+            "vehicle_id", "maintenance_type", "maintenance_date",
+        ),
     )
 
     def __repr__(self) -> str:
@@ -5,9 +5,9 @@ Including: PartsUsed (用料歷程) and PartsInventory (零件庫存)
 
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from uuid import uuid4, UUID as PyUUID
+from uuid import UUID as PyUUID, uuid4
 
-from sqlalchemy import String, Integer, Numeric, DateTime, ForeignKey, Index
+from sqlalchemy import String, Integer, Numeric, Boolean, DateTime, ForeignKey, Index, Computed, text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -22,10 +22,11 @@ class PartsInventory(Base):
     
     __tablename__ = "parts_inventory"
 
-    id: Mapped[UUID] = mapped_column(
+    id: Mapped[PyUUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4
+        default=uuid4,
+        server_default=text("gen_uuid_v7()")
     )
     part_number: Mapped[str] = mapped_column(
         String(50),
@@ -73,37 +74,45 @@ class PartsInventory(Base):
         comment="存放位置"
     )
     last_restock_date: Mapped[Optional[datetime]] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=True,
         comment="最後補貨日期"
     )
+    is_low_stock: Mapped[bool] = mapped_column(
+        Boolean,
+        Computed("quantity_on_hand <= minimum_quantity", persisted=True),
+        comment="庫存警示 (DB 計算欄位)"
+    )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow
+        server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow
+        server_default=func.now(),
+        onupdate=func.now()
     )
 
     # Relationships
+    # One-way read path (see Vehicle): no backref sync on ingest, writes
+    # go through PartsUsed(part_id=...).
     parts_used: Mapped[list["PartsUsed"]] = relationship(
-        back_populates="part",
-        lazy="selectin"
+        lazy="raise",
+        viewonly=True
     )
 
     __table_args__ = (
-        Index("idx_parts_low_stock", "quantity_on_hand", "minimum_quantity"),
+        # Partial index: only restock candidates are indexed, so the
+        # low-stock alert scan touches a tiny fraction of the table
+        Index(
+            "idx_parts_low_stock",
+            "part_number",
+            postgresql_where=text("is_low_stock"),
+        ),
     )
 
-    @property
-    def is_low_stock(self) -> bool:
-        """Check if stock is below minimum"""
-        return self.quantity_on_hand <= self.minimum_quantity
-
     def __repr__(self) -> str:
         return f"<PartsInventory(number={self.part_number}, qty={self.quantity_on_hand})>"
 
@@ -113,10 +122,11 @@ class PartsUsed(Base):
     
     __tablename__ = "parts_used"
 
-    id: Mapped[UUID] = mapped_column(
+    id: Mapped[PyUUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4
+        default=uuid4,
+        server_default=text("gen_uuid_v7()")
     )
     maintenance_id: Mapped[PyUUID] = mapped_column(
         UUID(as_uuid=True),
@@ -153,18 +163,25 @@ class PartsUsed(Base):
     )
     total_cost: Mapped[Optional[float]] = mapped_column(
         Numeric(12, 2),
+        Computed("quantity * unit_cost", persisted=True),
         nullable=True,
-        comment="總價"
+        comment="總價 (DB 計算欄位)"
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow
+        server_default=func.now()
     )
 
     # Relationships
-    maintenance_record: Mapped["MaintenanceRecord"] = relationship(back_populates="parts_used")
-    part: Mapped[Optional["PartsInventory"]] = relationship(back_populates="parts_used")
+    maintenance_record: Mapped["MaintenanceRecord"] = relationship(
+        lazy="raise",
+        viewonly=True
+    )
+    part: Mapped[Optional["PartsInventory"]] = relationship(
+        lazy="raise",
+        viewonly=True
+    )
 
     def __repr__(self) -> str:
         return f"<PartsUsed(part={self.part_number}, qty={self.quantity})>"
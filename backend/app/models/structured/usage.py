@@ -4,9 +4,9 @@ UsageRecord model - 使用歷程
 
 from datetime import datetime, date
 from typing import Optional, TYPE_CHECKING
-from uuid import uuid4, UUID as PyUUID
+from uuid import UUID as PyUUID, uuid4
 
-from sqlalchemy import String, Integer, Numeric, Date, DateTime, ForeignKey, Index
+from sqlalchemy import String, Integer, Numeric, Date, DateTime, ForeignKey, Index, text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -21,10 +21,11 @@ class UsageRecord(Base):
     
     __tablename__ = "usage_records"
 
-    id: Mapped[UUID] = mapped_column(
+    id: Mapped[PyUUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4
+        default=uuid4,
+        server_default=text("gen_uuid_v7()")
     )
     vehicle_id: Mapped[PyUUID] = mapped_column(
         UUID(as_uuid=True),
@@ -74,19 +75,22 @@ class UsageRecord(Base):
         comment="備註"
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow
+        server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow
+        server_default=func.now(),
+        onupdate=func.now()
     )
 
     # Relationships
-    vehicle: Mapped["Vehicle"] = relationship(back_populates="usage_records")
+    vehicle: Mapped["Vehicle"] = relationship(
+        lazy="raise",
+        viewonly=True
+    )
 
     __table_args__ = (
         Index("idx_usage_vehicle_date", "vehicle_id", "record_date"),
@@ -3,10 +3,10 @@ Vehicle model - 車輛基本資料
 """
 
 from datetime import datetime, date
-from typing import Optional, TYPE_CHECKING
-from uuid import uuid4
+from typing import NamedTuple, Optional, TYPE_CHECKING
+from uuid import UUID as PyUUID, uuid4
 
-from sqlalchemy import String, Integer, Date, DateTime, Index
+from sqlalchemy import Enum, String, Integer, Date, DateTime, Index, select, text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -24,10 +24,11 @@ class Vehicle(Base):
     
     __tablename__ = "vehicles"
 
-    id: Mapped[UUID] = mapped_column(
+    id: Mapped[PyUUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4
+        default=uuid4,
+        server_default=text("gen_uuid_v7()")
     )
     vehicle_code: Mapped[str] = mapped_column(
         String(20),
@@ -52,7 +53,7 @@ class Vehicle(Base):
         comment="製造年份"
     )
     status: Mapped[str] = mapped_column(
-        String(20),
+        Enum("active", "maintenance", "retired", name="vehicle_status"),
         nullable=False,
         default="active",
         comment="狀態: active/maintenance/retired"
@@ -69,33 +70,39 @@ class Vehicle(Base):
         comment="最後保養日期"
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow
+        server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow
+        server_default=func.now(),
+        onupdate=func.now()
     )
 
     # Relationships
+    # lazy="raise" forces loader choice to the query site: callers that
+    # need children must say so via options(selectinload(...)), and an
+    # accidental lazy load raises instead of firing hidden SELECTs.
+    # viewonly=True makes these one-way read paths: appends never have to
+    # sync a backref, so bulk ingest pays no attribute-event cost. Writes
+    # set the FK column directly (FaultRecord(vehicle_id=...)).
     fault_records: Mapped[list["FaultRecord"]] = relationship(
-        back_populates="vehicle",
-        lazy="selectin"
+        lazy="raise",
+        viewonly=True
     )
     maintenance_records: Mapped[list["MaintenanceRecord"]] = relationship(
-        back_populates="vehicle",
-        lazy="selectin"
+        lazy="raise",
+        viewonly=True
     )
     usage_records: Mapped[list["UsageRecord"]] = relationship(
-        back_populates="vehicle",
-        lazy="selectin"
+        lazy="raise",
+        viewonly=True
     )
     cost_records: Mapped[list["CostRecord"]] = relationship(
-        back_populates="vehicle",
-        lazy="selectin"
+        lazy="raise",
+        viewonly=True
     )
 
     __table_args__ = (
@@ -104,3 +111,34 @@ class Vehicle(Base):
 
     def __repr__(self) -> str:
         return f"<Vehicle(code={self.vehicle_code}, type={self.vehicle_type})>"
+
+
+class VehicleLite(NamedTuple):
+    """Narrow projection for list views.
+
+    Carries only the identifying columns, so listing vehicles never
+    instantiates full Vehicle objects or touches the relationship
+    collections.
+    """
+
+    id: PyUUID
+    vehicle_code: str
+    vehicle_type: str
+    status: str
+    depot: Optional[str]
+
+
+def select_vehicles_lite():
+    """Column-only SELECT whose rows map 1:1 onto VehicleLite.
+
+    Usage:
+        rows = (await session.execute(select_vehicles_lite())).all()
+        vehicles = [VehicleLite(*row) for row in rows]
+    """
+    return select(
+        Vehicle.id,
+        Vehicle.vehicle_code,
+        Vehicle.vehicle_type,
+        Vehicle.status,
+        Vehicle.depot,
+    ).order_by(Vehicle.vehicle_code)
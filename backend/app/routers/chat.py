@@ -1,21 +1,158 @@
 """Chat and search router for RAG queries."""
-import json
+import asyncio
+import threading
 import time
-from fastapi import APIRouter, Request
+
+import orjson
+from fastapi import APIRouter, Request, Response
 from fastapi.responses import StreamingResponse
 
+from pydantic import TypeAdapter
+
 from app.models.schemas import (
     ChatRequest,
     ChatResponse,
     SearchRequest,
     SearchResponse,
 )
+from app.config import get_settings
+from app.services import cache as cache_service
 from app.services import rag
 
 router = APIRouter(prefix="/api", tags=["chat"])
 
+# Cached response adapters: dump_json emits the response bytes in one
+# pydantic-core pass, with no per-request validator rebuild and no
+# jsonable_encoder walk.
+_CHAT_ADAPTER = TypeAdapter(ChatResponse)
+_SEARCH_ADAPTER = TypeAdapter(SearchResponse)
+
+
+# Memoized per-hit dumps. Popular queries return the same top-K chunks
+# over and over; re-dumping identical frozen SearchResults costs tens of
+# µs each. (id, score) identifies a hit's wire form - chunk ids are
+# UUIDs that change on re-upload, so entries can never go stale, only
+# unused; the cache is cleared wholesale when full.
+_DUMP_CACHE: dict[tuple[str, float], dict] = {}
+_DUMP_CACHE_MAX = 2048
+
+
+def _dump_results(results) -> list[dict]:
+    """Dump SearchResults for the wire, stripping base64 image payloads.
+
+    Images are referenced by image_url and fetched (and cached) by the
+    client separately, so responses never carry the 33%-inflated base64
+    bytes that are only needed internally for LLM prompting.
+    """
+    dumped = []
+    for result in results:
+        key = (result.id, result.score)
+        cached = _DUMP_CACHE.get(key)
+        if cached is None:
+            if len(_DUMP_CACHE) >= _DUMP_CACHE_MAX:
+                _DUMP_CACHE.clear()
+            cached = _DUMP_CACHE[key] = result.model_dump(
+                exclude={"image_base64"}
+            )
+        dumped.append(cached)
+    return dumped
+
+
+def _sse(payload: dict) -> bytes:
+    """Format one Server-Sent Event, serialized with orjson.
+
+    Returns bytes: StreamingResponse sends them as-is, skipping the
+    UTF-8 encode Starlette performs on str chunks.
+    """
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+# Frame templates: the envelopes never vary, so they are built once at
+# import instead of re-serializing a wrapper dict per event.
+_CONTENT_PREFIX = b'data: {"type":"content","data":'
+_ERROR_PREFIX = b'data: {"type":"error","data":'
+_METADATA_PREFIX = b'data: {"type":"metadata","data":'
+_FRAME_SUFFIX = b"}\n\n"
+_SSE_DONE = b'data: {"type":"done"}\n\n'
+
+
+def _sse_content(chunk: str) -> bytes:
+    """Hot-path content frame: only the token payload gets encoded."""
+    return _CONTENT_PREFIX + orjson.dumps(chunk) + _FRAME_SUFFIX
+
+
+def _sse_error(detail: str) -> bytes:
+    """Error frame from the same byte-template scheme."""
+    return _ERROR_PREFIX + orjson.dumps(detail) + _FRAME_SUFFIX
+
+
+def _sse_metadata(duration_ms: int, tokens) -> bytes:
+    """Metadata frame from the same byte-template scheme."""
+    payload = {"model": "gpt-4o", "duration_ms": duration_ms, "tokens": tokens}
+    return _METADATA_PREFIX + orjson.dumps(payload) + _FRAME_SUFFIX
+
+
+# Sentinel marking the end of a thread-driven stream.
+_STREAM_DONE = object()
+
+
+async def _stream_in_thread(gen):
+    """Drive a synchronous generator on a worker thread, yielding async.
 
-@router.post("/chat", response_model=ChatResponse)
+    The rag streaming calls block on OpenAI network I/O; iterating them
+    directly inside an async generator would pin the event loop for the
+    whole response and serialize concurrent SSE connections. A producer
+    thread pushes items onto a bounded queue (so the LLM cannot outrun a
+    slow client unbounded) while the loop stays free to multiplex other
+    requests.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+    error: list[BaseException] = []
+    stop = threading.Event()
+
+    def _produce() -> None:
+        try:
+            for item in gen:
+                if stop.is_set():
+                    break
+                asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+        except BaseException as exc:
+            error.append(exc)
+        finally:
+            # Close the generator so the underlying LLM HTTP stream is
+            # released instead of fully consumed after an early exit
+            try:
+                gen.close()
+            except Exception:
+                pass
+            asyncio.run_coroutine_threadsafe(queue.put(_STREAM_DONE), loop).result()
+
+    producer = loop.run_in_executor(None, _produce)
+    finished = False
+    try:
+        while True:
+            item = await queue.get()
+            if item is _STREAM_DONE:
+                finished = True
+                if error:
+                    raise error[0]
+                break
+            yield item
+    finally:
+        if not finished:
+            # Consumer exited early (client disconnect): tell the
+            # producer to abandon the stream at the next token, then
+            # drain until its sentinel so a blocked queue.put can
+            # finish. Blocking on queue.get keeps the event loop idle
+            # while the producer waits on OpenAI between tokens.
+            stop.set()
+            while await queue.get() is not _STREAM_DONE:
+                pass
+        await producer
+
+
+@router.post("/chat", responses={200: {"model": ChatResponse}})
 async def chat(request: ChatRequest):
     """
     Chat with the knowledge base using RAG.
@@ -29,10 +166,16 @@ async def chat(request: ChatRequest):
         top_k=request.top_k,
     )
 
-    return ChatResponse(
-        answer=answer,
-        sources=sources,
+    # Sources are trusted SearchResult objects built internally; dumping
+    # through the cached adapter skips FastAPI's jsonable_encoder pass and
+    # response-model re-validation, which dominate latency when sources
+    # carry base64 image payloads (stripped here - clients use image_url).
+    # The responses= entry keeps the OpenAPI schema response_model gave.
+    body = _CHAT_ADAPTER.dump_json(
+        ChatResponse.model_construct(answer=answer, sources=sources),
+        exclude={"sources": {"__all__": {"image_base64"}}},
     )
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/chat/stream")
@@ -51,64 +194,141 @@ async def chat_stream(request: ChatRequest):
     """
     async def generate():
         try:
-            # First, search for relevant documents and send sources
-            sources = rag.search(
+            # Answer cache: a hit replays the stored stream and skips
+            # the embedding, vector search and both LLM calls.
+            cached = await asyncio.to_thread(
+                cache_service.get_cached_answer,
+                request.query,
+                request.image_base64,
+                request.top_k,
+            )
+            if cached:
+                yield _sse({'type': 'sources', 'data': cached['sources']})
+                yield _sse_content(cached['answer'])
+                yield _sse_metadata(0, None)
+                yield _SSE_DONE
+                if cached.get('follow_up'):
+                    yield _sse({'type': 'follow_up', 'data': cached['follow_up']})
+                return
+
+            # First, search for relevant documents and send sources.
+            # Off the loop: rag.search blocks on embedding + vector store.
+            sources = await asyncio.to_thread(
+                rag.search,
                 query=request.query,
                 image_base64=request.image_base64,
                 top_k=request.top_k,
             )
 
             # Send sources first
-            sources_data = [s.model_dump() for s in sources]
-            yield f"data: {json.dumps({'type': 'sources', 'data': sources_data})}\n\n"
+            sources_data = _dump_results(sources)
+            yield _sse({'type': 'sources', 'data': sources_data})
+
+            # Nothing retrieved: answer with the canned reply and skip
+            # both LLM calls (answer stream and follow-up generation)
+            if not sources and get_settings().empty_sources_short_circuit:
+                yield _sse_content(rag.NO_SOURCES_MESSAGE)
+                yield _sse_metadata(0, None)
+                yield _SSE_DONE
+                return
 
-            # Track timing and tokens
-            start_time = time.time()
+            # Track timing and tokens (monotonic, no wall-clock syscall
+            # on the stream-close path)
+            start_ns = time.perf_counter_ns()
             total_tokens = None
             full_answer = ""
 
-            # Then stream the answer
-            for result in rag.chat_stream_with_metadata(
-                query=request.query,
-                sources=sources,
-                image_base64=request.image_base64,
+            # Token coalescing: one SSE frame per LLM token means one
+            # serialize + one write syscall per token. Buffering tokens
+            # and flushing every ~256 chars or 15 ms amortizes that
+            # overhead without visibly changing the typing effect.
+            buf: list[str] = []
+            buf_len = 0
+            last_flush = time.monotonic()
+
+            # Follow-up generation starts mid-stream once enough answer
+            # prefix exists to suggest from, so the second LLM call
+            # overlaps the remainder of the first (wall clock ~ max of
+            # the two instead of their sum).
+            follow_up_task = None
+
+            def _start_follow_up():
+                return asyncio.create_task(
+                    asyncio.to_thread(
+                        rag.generate_follow_up_questions,
+                        query=request.query,
+                        answer=full_answer,
+                        max_questions=3,
+                    )
+                )
+
+            # Then stream the answer, driving the blocking OpenAI
+            # stream from a worker thread
+            async for result in _stream_in_thread(
+                rag.chat_stream_with_metadata(
+                    query=request.query,
+                    sources=sources,
+                    image_base64=request.image_base64,
+                )
             ):
                 if result.get("type") == "content":
                     content_chunk = result['data']
                     full_answer += content_chunk
-                    yield f"data: {json.dumps({'type': 'content', 'data': content_chunk})}\n\n"
+                    buf.append(content_chunk)
+                    buf_len += len(content_chunk)
+                    if follow_up_task is None and len(full_answer) >= 400:
+                        follow_up_task = _start_follow_up()
+                    now = time.monotonic()
+                    if buf_len >= 256 or now - last_flush >= 0.015:
+                        yield _sse_content("".join(buf))
+                        buf.clear()
+                        buf_len = 0
+                        last_flush = now
                 elif result.get("type") == "usage":
                     total_tokens = result.get("data")
 
-            # Calculate duration
-            duration_ms = int((time.time() - start_time) * 1000)
+            # Flush whatever is left before the trailing frames
+            if buf:
+                yield _sse_content("".join(buf))
+                buf.clear()
+
+            # Short answers never crossed the prefix threshold: start
+            # the follow-up task now so it still overlaps the
+            # metadata/done frames and their network flush.
+            if follow_up_task is None:
+                follow_up_task = _start_follow_up()
 
             # Send metadata
-            metadata = {
-                "model": "gpt-4o",
-                "duration_ms": duration_ms,
-                "tokens": total_tokens,
-            }
-            yield f"data: {json.dumps({'type': 'metadata', 'data': metadata})}\n\n"
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            yield _sse_metadata(duration_ms, total_tokens)
 
             # Signal completion first (so sources show immediately)
-            yield f"data: {json.dumps({'type': 'done'})}\n\n"
+            yield _SSE_DONE
 
-            # Generate and send follow-up questions (after done, so it doesn't block UI)
+            # Send follow-up questions (after done, so they don't block UI)
+            follow_up_questions = None
             try:
-                follow_up_questions = rag.generate_follow_up_questions(
-                    query=request.query,
-                    answer=full_answer,
-                    max_questions=3,
-                )
+                follow_up_questions = await follow_up_task
                 if follow_up_questions:
-                    yield f"data: {json.dumps({'type': 'follow_up', 'data': follow_up_questions})}\n\n"
-            except Exception as e:
+                    yield _sse({'type': 'follow_up', 'data': follow_up_questions})
+            except Exception:
                 # Don't fail the whole request if follow-up generation fails
                 pass
 
+            # Store the finished stream for replay on repeats
+            if sources:
+                await asyncio.to_thread(
+                    cache_service.set_cached_answer,
+                    request.query,
+                    request.image_base64,
+                    request.top_k,
+                    full_answer,
+                    sources_data,
+                    follow_up_questions,
+                )
+
         except Exception as e:
-            yield f"data: {json.dumps({'type': 'error', 'data': str(e)})}\n\n"
+            yield _sse_error(str(e))
 
     return StreamingResponse(
         generate(),
@@ -121,7 +341,7 @@ async def chat_stream(request: ChatRequest):
     )
 
 
-@router.post("/search", response_model=SearchResponse)
+@router.post("/search", responses={200: {"model": SearchResponse}})
 async def search(request: SearchRequest):
     """
     Search the knowledge base without generating an answer.
@@ -133,7 +353,8 @@ async def search(request: SearchRequest):
         top_k=request.top_k,
     )
 
-    return SearchResponse(
-        results=results,
-        total=len(results),
+    body = _SEARCH_ADAPTER.dump_json(
+        SearchResponse.model_construct(results=results, total=len(results)),
+        exclude={"results": {"__all__": {"image_base64"}}},
     )
+    return Response(content=body, media_type="application/json")
@@ -8,7 +8,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
-from app.db.session import get_db
+from app.services.cache import cache_response
 from app.services.dashboard_service import get_dashboard_service
 
 
@@ -60,6 +60,7 @@ class InventoryAlertResponse(BaseModel):
 
 
 @router.get("/summary", response_model=SummaryResponse)
+@cache_response("dash:summary", ttl=60, swr=30)
 async def get_summary():
     """
     Get dashboard summary statistics.
@@ -76,6 +77,7 @@ async def get_summary():
 
 
 @router.get("/fault-trends", response_model=List[FaultTrendResponse])
+@cache_response("dash:fault-trends:{days}", ttl=60, swr=30)
 async def get_fault_trends(
     days: int = Query(30, ge=1, le=365, description="Number of days to look back")
 ):
@@ -89,6 +91,7 @@ async def get_fault_trends(
 
 
 @router.get("/cost-distribution", response_model=List[CostDistributionResponse])
+@cache_response("dash:cost-distribution:{months}", ttl=60, swr=30)
 async def get_cost_distribution(
     months: int = Query(3, ge=1, le=12, description="Number of months to look back")
 ):
@@ -102,6 +105,7 @@ async def get_cost_distribution(
 
 
 @router.get("/vehicle-fault-ranking", response_model=List[VehicleFaultRankResponse])
+@cache_response("dash:vehicle-fault-ranking:{limit}", ttl=60, swr=30)
 async def get_vehicle_fault_ranking(
     limit: int = Query(10, ge=1, le=100, description="Number of vehicles to return")
 ):
@@ -115,6 +119,7 @@ async def get_vehicle_fault_ranking(
 
 
 @router.get("/inventory-alerts", response_model=List[InventoryAlertResponse])
+@cache_response("dash:inventory-alerts", ttl=60, swr=30)
 async def get_inventory_alerts():
     """
     Get low stock inventory alerts.
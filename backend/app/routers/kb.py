@@ -1,8 +1,11 @@
 """Knowledge base router for upload and document management."""
+import asyncio
+import base64
+import logging
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import quote
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, Query, Request, UploadFile, File, HTTPException, Response
 from fastapi.responses import FileResponse
 
 from app.models.schemas import (
@@ -28,11 +31,25 @@ from app.services import cache as cache_service
 from app.services import file_storage
 from app.services import evaluation as evaluation_service
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/kb", tags=["knowledge-base"])
 
+# Upload limits: reject as soon as the running total crosses the cap
+# instead of buffering an arbitrarily large body first.
+MAX_UPLOAD_SIZE = 50 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB per read
+
+
+def _file_etag(stat_result) -> str:
+    """Weak ETag from (inode, mtime, size) - no content read needed."""
+    return (
+        f'W/"{stat_result.st_ino}-{int(stat_result.st_mtime)}-{stat_result.st_size}"'
+    )
+
 
 @router.post("/upload", response_model=UploadResponse)
-async def upload_document(file: UploadFile = File(...)):
+async def upload_document(request: Request, file: UploadFile = File(...)):
     """
     Upload a document (PDF or image) to the knowledge base.
 
@@ -46,16 +63,35 @@ async def upload_document(file: UploadFile = File(...)):
             detail="不支援的檔案格式。請上傳 PDF、Word (.docx)、Excel (.xlsx, .xls) 或圖片檔案。",
         )
 
-    # Read file content
-    content = await file.read()
-
-    # Check file size (50MB limit)
-    if len(content) > 50 * 1024 * 1024:
+    # Reject obviously oversize uploads from the Content-Length header
+    # before reading a single body byte. One chunk of slack covers the
+    # multipart envelope around the file; the chunked read below remains
+    # the authoritative limit for the file itself.
+    content_length = int(request.headers.get("content-length") or 0)
+    if content_length > MAX_UPLOAD_SIZE + UPLOAD_CHUNK_SIZE:
         raise HTTPException(
-            status_code=400,
+            status_code=413,
             detail="檔案大小超過 50MB 限制。",
         )
 
+    # Read file content in bounded chunks, enforcing the 50MB limit as
+    # bytes arrive: oversize uploads are refused mid-transfer instead of
+    # being buffered whole before the check. (The document parsers all
+    # consume in-memory bytes, so accepted files are joined once here -
+    # peak memory is bounded by the limit itself.)
+    chunks: list[bytes] = []
+    total_size = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        total_size += len(chunk)
+        if total_size > MAX_UPLOAD_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail="檔案大小超過 50MB 限制。",
+            )
+        chunks.append(chunk)
+    content = b"".join(chunks)
+    del chunks
+
     try:
         if file_type == "pdf":
             doc_id, chunk_count = await document_processor.process_pdf(content, file.filename)
@@ -111,12 +147,37 @@ async def list_documents():
     )
 
 
+@router.delete("/documents", response_model=DeleteResponse)
+async def delete_documents_bulk(ids: list[str] = Query(...)):
+    """Delete several documents in one request.
+
+    Multi-select deletes hit the vector store and cache once for the
+    whole batch instead of one round trip per document.
+    """
+    deleted = await vector_store.delete_documents(ids)
+
+    if not deleted:
+        raise HTTPException(
+            status_code=404,
+            detail="找不到任何指定的文件",
+        )
+
+    # One invalidation covers the batch (query caches are cleared
+    # wholesale on document changes)
+    cache_service.invalidate_cache(document_id=deleted[0])
+
+    return DeleteResponse(
+        success=True,
+        message=f"成功刪除 {len(deleted)} 份文件",
+    )
+
+
 @router.delete("/documents/{document_id}", response_model=DeleteResponse)
 async def delete_document(document_id: str):
     """Delete a document and its chunks from the knowledge base."""
-    success = await vector_store.delete_document(document_id)
+    deleted = await vector_store.delete_documents([document_id])
 
-    if not success:
+    if not deleted:
         raise HTTPException(
             status_code=404,
             detail=f"找不到文件 ID: {document_id}",
@@ -143,16 +204,13 @@ async def get_stats():
 # ============================================================================
 
 @router.get("/documents/{document_id}/file")
-async def get_document_file(document_id: str):
+async def get_document_file(document_id: str, request: Request):
     """
     Get the original document file for preview or download.
 
     - PDF files: Displayed inline in browser (Content-Disposition: inline)
     - Word/Image files: Trigger download (Content-Disposition: attachment)
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
     file_info = file_storage.get_file_info(document_id)
 
     if not file_info:
@@ -162,15 +220,30 @@ async def get_document_file(document_id: str):
             detail="找不到原始檔案",
         )
 
-    # Verify file actually exists
+    # Verify file actually exists. The stat doubles as FileResponse's
+    # stat_result so the file is stat'ed once per request, not twice.
     file_path = Path(file_info["file_path"])
-    if not file_path.exists():
+    try:
+        stat_result = file_path.stat()
+    except OSError:
         logger.error(f"File path does not exist: {file_path}")
         raise HTTPException(
             status_code=404,
             detail=f"檔案不存在: {file_info['filename']}",
         )
 
+    # Conditional request: a matching ETag means the browser's cached
+    # copy is current, so answer 304 and ship zero file bytes.
+    etag = _file_etag(stat_result)
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=304,
+            headers={
+                "ETag": etag,
+                "Cache-Control": "private, max-age=86400, immutable",
+            },
+        )
+
     # Determine content disposition based on file type
     # Use RFC 5987 encoding for non-ASCII filenames
     filename = file_info["filename"]
@@ -186,11 +259,52 @@ async def get_document_file(document_id: str):
 
     logger.info(f"Serving file: {file_path} as {file_info['content_type']}")
     
+    # Stored files are immutable per document_id, so let the browser cache
+    # them instead of re-downloading on every preview. FileResponse adds
+    # ETag/Last-Modified for conditional revalidation after expiry.
     return FileResponse(
         path=str(file_path),
         filename=filename,
         media_type=file_info["content_type"],
-        headers={"Content-Disposition": content_disposition},
+        stat_result=stat_result,
+        headers={
+            "Content-Disposition": content_disposition,
+            "Cache-Control": "private, max-age=86400, immutable",
+            "ETag": etag,
+        },
+    )
+
+
+@router.get("/chunks/{chunk_id}/image")
+async def get_chunk_image(chunk_id: str, request: Request):
+    """
+    Get the image bytes for an image chunk.
+
+    Search responses reference this endpoint via image_url instead of
+    embedding base64 payloads, so the bytes travel once and are then
+    served from the browser cache (chunk images never change).
+    """
+    # A chunk's bytes never change once ingested (re-uploads mint new
+    # chunk ids), so the id itself is a valid ETag and revalidation can
+    # 304 before the Qdrant fetch and base64 decode.
+    etag = f'W/"{chunk_id}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    payload = vector_store.get_image_chunk(chunk_id)
+    if not payload or not payload.get("image_base64"):
+        raise HTTPException(
+            status_code=404,
+            detail="找不到圖片",
+        )
+
+    return Response(
+        content=base64.b64decode(payload["image_base64"]),
+        media_type="image/jpeg",
+        headers={
+            "Cache-Control": "private, max-age=86400, immutable",
+            "ETag": etag,
+        },
     )
 
 
@@ -202,7 +316,12 @@ async def get_document_file(document_id: str):
 async def create_backup(collection_name: str = "text_chunks"):
     """Create a new backup of the vector database collection."""
     try:
-        record = backup_service.create_backup(collection_name)
+        # The backup service talks to Qdrant with blocking HTTP calls
+        # (snapshot + multi-GB download, up to 10 minutes); run it on a
+        # worker thread so the event loop keeps serving other requests.
+        record = await asyncio.to_thread(
+            backup_service.create_backup, collection_name
+        )
         return record
     except Exception as e:
         raise HTTPException(
@@ -234,7 +353,8 @@ async def get_backup(backup_id: str):
 async def restore_backup(backup_id: str):
     """Restore from a backup."""
     try:
-        record = backup_service.restore_backup(backup_id)
+        # Blocking snapshot upload + recovery; keep it off the event loop
+        record = await asyncio.to_thread(backup_service.restore_backup, backup_id)
         return {
             "message": f"成功從備份 {backup_id} 恢復資料",
             "backup_id": backup_id,
@@ -252,7 +372,8 @@ async def restore_backup(backup_id: str):
 @router.delete("/backups/{backup_id}", status_code=204)
 async def delete_backup(backup_id: str):
     """Delete a backup record and its snapshot file."""
-    success = backup_service.delete_backup(backup_id)
+    # Unlinks a potentially multi-GB snapshot file; offload the disk I/O
+    success = await asyncio.to_thread(backup_service.delete_backup, backup_id)
     if not success:
         raise HTTPException(
             status_code=404,
@@ -262,7 +383,7 @@ async def delete_backup(backup_id: str):
 
 
 @router.get("/backups/{backup_id}/download")
-async def download_backup(backup_id: str):
+async def download_backup(backup_id: str, request: Request):
     """Download a backup snapshot file."""
     file_path = backup_service.get_backup_file_path(backup_id)
     if not file_path:
@@ -270,10 +391,22 @@ async def download_backup(backup_id: str):
             status_code=404,
             detail=f"找不到備份檔案: {backup_id}",
         )
+    try:
+        stat_result = file_path.stat()
+    except OSError:
+        raise HTTPException(
+            status_code=404,
+            detail=f"找不到備份檔案: {backup_id}",
+        )
+    etag = _file_etag(stat_result)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
     return FileResponse(
         path=file_path,
         filename=file_path.name,
         media_type="application/octet-stream",
+        stat_result=stat_result,
+        headers={"ETag": etag},
     )
 
 
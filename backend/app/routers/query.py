@@ -3,12 +3,15 @@ Unified Query API - Handles natural language queries.
 Routes to appropriate backend (RAG or Structured Data) based on intent.
 """
 
+import time
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 from app.db.session import get_db
 from app.services.nl2sql_service import get_nl2sql_service
@@ -24,10 +27,17 @@ class QueryRequest(BaseModel):
     query: str
     context: Optional[str] = None
     include_sources: bool = True
+    # /query/sql only: stream rows as NDJSON instead of a buffered
+    # QueryResponse (constant memory for large result sets)
+    stream: bool = False
 
 
 class StructuredDataResult(BaseModel):
     """Structured data query result"""
+    # Frozen response models share their validated core schema and never
+    # need copy-on-write paths (same convention as schemas.py)
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     type: str = "structured"
     sql: str
     data: List[Dict[str, Any]]
@@ -38,6 +48,8 @@ class StructuredDataResult(BaseModel):
 
 class IntentInfo(BaseModel):
     """Intent classification info"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     intent: str
     confidence: float
     entities: Dict[str, Any]
@@ -46,6 +58,8 @@ class IntentInfo(BaseModel):
 
 class QueryResponse(BaseModel):
     """Unified query response"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     success: bool
     query: str
     query_type: str  # "structured", "knowledge", "hybrid", "clarification"
@@ -58,42 +72,72 @@ class QueryResponse(BaseModel):
     timestamp: str
 
 
-@router.post("", response_model=QueryResponse)
+# Cached adapters: dump_json writes the response bytes in one
+# pydantic-core pass. The default response_model path walks every row of
+# StructuredDataResult.data through jsonable_encoder and re-validates,
+# which dominates CPU once result sets reach a few hundred rows.
+_QUERY_ADAPTER = TypeAdapter(QueryResponse)
+_INTENT_ADAPTER = TypeAdapter(IntentInfo)
+
+
+def _query_response(response: QueryResponse) -> Response:
+    """Serialize a QueryResponse straight to bytes via the cached adapter."""
+    return Response(
+        content=_QUERY_ADAPTER.dump_json(response),
+        media_type="application/json",
+    )
+
+
+# Response timestamps are informational and second-granularity is plenty,
+# so the ISO string is formatted at most once per second instead of
+# calling datetime.now().isoformat() on every request.
+_TS_CACHE: tuple[int, str] = (0, "")
+
+
+def _timestamp() -> str:
+    global _TS_CACHE
+    sec = int(time.time())
+    if sec != _TS_CACHE[0]:
+        _TS_CACHE = (sec, datetime.now().isoformat(timespec="seconds"))
+    return _TS_CACHE[1]
+
+
+@router.post("", responses={200: {"model": QueryResponse}})
 async def unified_query(
     request: QueryRequest,
     db: AsyncSession = Depends(get_db)
 ):
     """
     Process a natural language query with intelligent routing.
-    
+
     Uses AI intent classification to determine the best processing path:
     - **structured**: Query structured data (vehicles, faults, maintenance, costs)
     - **knowledge**: Query knowledge base documents (manuals, procedures)
     - **hybrid**: Combine both structured data and knowledge
     - **clarification**: Request more information from user
-    
+
     Examples:
     - "查詢 EMU801 故障歷程" → Structured (SQL query)
     - "轉向架維修標準流程" → Knowledge (RAG search)
     - "EMU801 煞車系統故障原因分析" → Hybrid (both)
     """
-    timestamp = datetime.now().isoformat()
-    
+    timestamp = _timestamp()
+
     try:
         # Step 1: Classify intent
         classifier = get_intent_classifier()
         intent_result = await classifier.classify(request.query, request.context)
-        
+
         intent_info = IntentInfo(
             intent=intent_result.intent.value,
             confidence=intent_result.confidence,
             entities=intent_result.entities,
             reasoning=intent_result.reasoning
         )
-        
+
         # Step 2: Route based on intent
         if intent_result.intent == QueryIntent.CLARIFICATION:
-            return QueryResponse(
+            return _query_response(QueryResponse(
                 success=True,
                 query=request.query,
                 query_type="clarification",
@@ -101,11 +145,11 @@ async def unified_query(
                 message="請提供更多資訊以便我更準確地回答您的問題。",
                 suggested_queries=intent_result.suggested_queries,
                 timestamp=timestamp
-            )
-        
+            ))
+
         if intent_result.intent == QueryIntent.KNOWLEDGE:
             # TODO: Integrate with existing RAG service
-            return QueryResponse(
+            return _query_response(QueryResponse(
                 success=True,
                 query=request.query,
                 query_type="knowledge",
@@ -113,50 +157,52 @@ async def unified_query(
                 message="正在知識庫中搜尋相關資料...",
                 knowledge_result={"status": "pending", "note": "RAG integration coming"},
                 timestamp=timestamp
-            )
-        
+            ))
+
         # Structured or Hybrid - execute SQL query
         nl2sql = get_nl2sql_service()
         structured = get_structured_query_service(db)
-        
+
         sql_query = await nl2sql.convert_to_sql(request.query, request.context)
-        
+
         if sql_query.is_valid and sql_query.sql:
             result = await structured.execute_sql(sql_query.sql)
-            
+
             if result.success:
-                response = QueryResponse(
+                # For hybrid, add note about knowledge search
+                message = None
+                if intent_result.intent == QueryIntent.HYBRID:
+                    message = "已查詢結構化資料。知識庫搜尋功能開發中。"
+
+                # Rows were already serialized by the query service;
+                # model_construct skips re-validating every dict
+                return _query_response(QueryResponse.model_construct(
                     success=True,
                     query=request.query,
                     query_type=intent_result.intent.value,
                     intent_info=intent_info,
-                    structured_result=StructuredDataResult(
+                    structured_result=StructuredDataResult.model_construct(
                         sql=sql_query.sql,
                         data=result.data,
                         row_count=result.row_count,
                         columns=result.columns,
                         execution_time_ms=result.execution_time_ms
                     ),
+                    message=message,
                     timestamp=timestamp
-                )
-                
-                # For hybrid, add note about knowledge search
-                if intent_result.intent == QueryIntent.HYBRID:
-                    response.message = "已查詢結構化資料。知識庫搜尋功能開發中。"
-                
-                return response
+                ))
             else:
-                return QueryResponse(
+                return _query_response(QueryResponse(
                     success=False,
                     query=request.query,
                     query_type=intent_result.intent.value,
                     intent_info=intent_info,
                     error=result.error,
                     timestamp=timestamp
-                )
-        
+                ))
+
         # SQL conversion failed
-        return QueryResponse(
+        return _query_response(QueryResponse(
             success=False,
             query=request.query,
             query_type="clarification",
@@ -165,71 +211,88 @@ async def unified_query(
             error=sql_query.error,
             suggested_queries=["請嘗試更具體的描述，例如：查詢 EMU801 故障歷程"],
             timestamp=timestamp
-        )
-        
+        ))
+
     except Exception as e:
-        return QueryResponse(
+        return _query_response(QueryResponse(
             success=False,
             query=request.query,
             query_type="error",
             error=str(e),
             timestamp=timestamp
-        )
+        ))
 
 
-@router.post("/classify", response_model=IntentInfo)
+@router.post("/classify", responses={200: {"model": IntentInfo}})
 async def classify_intent(request: QueryRequest):
     """
     Classify query intent without executing.
-    
+
     Useful for preview/debugging intent classification.
     """
     classifier = get_intent_classifier()
     result = await classifier.classify(request.query, request.context)
-    
-    return IntentInfo(
+
+    body = _INTENT_ADAPTER.dump_json(IntentInfo(
         intent=result.intent.value,
         confidence=result.confidence,
         entities=result.entities,
         reasoning=result.reasoning
-    )
+    ))
+    return Response(content=body, media_type="application/json")
 
 
-@router.post("/sql", response_model=QueryResponse)
+@router.post("/sql", responses={200: {"model": QueryResponse}})
 async def direct_sql_query(
     request: QueryRequest,
     db: AsyncSession = Depends(get_db)
 ):
     """
     Convert natural language to SQL and execute (bypass intent classification).
-    
+
     Use this endpoint when you know the query is for structured data.
     """
-    timestamp = datetime.now().isoformat()
-    
+    timestamp = _timestamp()
+
     try:
         nl2sql = get_nl2sql_service()
         structured = get_structured_query_service(db)
-        
+
         sql_query = await nl2sql.convert_to_sql(request.query, request.context)
-        
+
         if not sql_query.is_valid:
-            return QueryResponse(
+            return _query_response(QueryResponse(
                 success=False,
                 query=request.query,
                 query_type="structured",
                 error=sql_query.error or "無法轉換為 SQL",
                 timestamp=timestamp
+            ))
+
+        if request.stream:
+            # Server-side cursor → NDJSON: rows go out as they arrive
+            # from the DB instead of materializing the full list[dict]
+            # first, so memory stays flat regardless of row count and
+            # the first byte ships immediately. Opt-in because the
+            # response shape differs from QueryResponse.
+            async def ndjson_rows():
+                async for row in structured.stream_sql(sql_query.sql):
+                    yield orjson.dumps(row) + b"\n"
+
+            return StreamingResponse(
+                ndjson_rows(), media_type="application/x-ndjson"
             )
-        
+
         result = await structured.execute_sql(sql_query.sql)
-        
+
         if result.success:
-            return QueryResponse(
+            # Rows were already serialized by the query service;
+            # model_construct skips re-validating every dict
+            return _query_response(QueryResponse.model_construct(
                 success=True,
                 query=request.query,
                 query_type="structured",
-                structured_result=StructuredDataResult(
+                structured_result=StructuredDataResult.model_construct(
                     sql=sql_query.sql,
                     data=result.data,
                     row_count=result.row_count,
@@ -237,21 +300,21 @@ async def direct_sql_query(
                     execution_time_ms=result.execution_time_ms
                 ),
                 timestamp=timestamp
-            )
+            ))
         else:
-            return QueryResponse(
+            return _query_response(QueryResponse(
                 success=False,
                 query=request.query,
                 query_type="structured",
                 error=result.error,
                 timestamp=timestamp
-            )
-            
+            ))
+
     except Exception as e:
-        return QueryResponse(
+        return _query_response(QueryResponse(
             success=False,
             query=request.query,
             query_type="error",
             error=str(e),
             timestamp=timestamp
-        )
+        ))
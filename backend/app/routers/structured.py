@@ -16,6 +16,28 @@ from app.services.structured_query import get_structured_query_service, QueryRes
 router = APIRouter(prefix="/structured", tags=["Structured Data"])
 
 
+# Vehicle detail lookup, bound once at import. The open-fault count is
+# a join + filtered aggregate instead of a correlated subquery, and the
+# constant statement text lets asyncpg reuse its cached prepared plan
+# across requests.
+_VEHICLE_BY_CODE_SQL = """
+SELECT
+    v.id,
+    v.vehicle_code,
+    v.vehicle_type,
+    v.manufacturer,
+    v.manufacture_year,
+    v.status,
+    v.depot,
+    v.last_maintenance_date,
+    COUNT(f.id) FILTER (WHERE f.status = 'open') AS open_faults
+FROM vehicles v
+LEFT JOIN fault_records f ON f.vehicle_id = v.id
+WHERE v.vehicle_code = :vehicle_code
+GROUP BY v.id
+"""
+
+
 # Response models
 class VehicleResponse(BaseModel):
     id: str
@@ -140,24 +162,9 @@ async def get_vehicle(
     Get a specific vehicle by code.
     """
     service = get_structured_query_service(db)
-    result = await service.get_vehicles(limit=1)
-    
-    # Filter to specific vehicle
-    sql = """
-    SELECT 
-        v.id,
-        v.vehicle_code,
-        v.vehicle_type,
-        v.manufacturer,
-        v.manufacture_year,
-        v.status,
-        v.depot,
-        v.last_maintenance_date,
-        (SELECT COUNT(*) FROM fault_records f WHERE f.vehicle_id = v.id AND f.status = 'open') as open_faults
-    FROM vehicles v
-    WHERE v.vehicle_code = :vehicle_code
-    """
-    result = await service.execute_sql(sql, {"vehicle_code": vehicle_code})
+    result = await service.execute_sql(
+        _VEHICLE_BY_CODE_SQL, {"vehicle_code": vehicle_code}
+    )
     
     if result.row_count == 0:
         raise HTTPException(status_code=404, detail=f"Vehicle {vehicle_code} not found")
@@ -3,6 +3,8 @@ import asyncio
 import json
 import logging
 from typing import Optional
+
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from app.models.schemas import ProgressMessage, TaskStatus
@@ -12,30 +14,44 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["websocket"])
 
-# Active WebSocket connections per task
-_active_connections: dict[str, list[WebSocket]] = {}
+# Active WebSocket connections per task. Sets keep add/remove/contains
+# O(1); broadcast order across subscribers doesn't matter.
+_active_connections: dict[str, set[WebSocket]] = {}
+
+# Compiled pydantic-core serializer for progress frames; to_json emits
+# bytes directly without the model_dump_json Python wrapper per tick
+_PROGRESS_SERIALIZER = ProgressMessage.__pydantic_serializer__
+
+# Constant control frames, serialized once at import
+_PONG_FRAME = '{"action": "pong"}'
+_HEARTBEAT_FRAME = '{"heartbeat": true}'
 
 
 async def broadcast_progress(task_id: str, message: ProgressMessage) -> None:
     """Broadcast progress to all connected clients for a task."""
-    connections = _active_connections.get(task_id, [])
+    connections = _active_connections.get(task_id)
     if not connections:
         return
 
-    message_json = message.model_dump_json()
-    disconnected = []
+    # decode() keeps these as text frames for browser clients
+    message_json = _PROGRESS_SERIALIZER.to_json(message).decode()
 
-    for ws in connections:
-        try:
-            await ws.send_text(message_json)
-        except Exception as e:
-            logger.warning(f"Failed to send to WebSocket: {e}")
-            disconnected.append(ws)
+    # Snapshot: the set can be mutated by connects/disconnects while
+    # the sends below await. Sends run concurrently so one slow or
+    # backpressured client doesn't serialize the whole fan-out.
+    conns = list(connections)
+    results = await asyncio.gather(
+        *(ws.send_text(message_json) for ws in conns),
+        return_exceptions=True,
+    )
 
     # Remove disconnected clients
-    for ws in disconnected:
-        if ws in connections:
-            connections.remove(ws)
+    disconnected = set()
+    for ws, result in zip(conns, results):
+        if isinstance(result, BaseException):
+            logger.warning("Failed to send to WebSocket: %s", result)
+            disconnected.add(ws)
+    connections -= disconnected
 
 
 def _sync_progress_callback(message: ProgressMessage) -> None:
@@ -59,12 +75,10 @@ def _sync_progress_callback(message: ProgressMessage) -> None:
 async def websocket_upload_progress(websocket: WebSocket, task_id: str):
     """WebSocket endpoint for upload progress updates."""
     await websocket.accept()
-    logger.info(f"WebSocket connected for task: {task_id}")
+    logger.info("WebSocket connected for task: %s", task_id)
 
     # Add to active connections
-    if task_id not in _active_connections:
-        _active_connections[task_id] = []
-    _active_connections[task_id].append(websocket)
+    _active_connections.setdefault(task_id, set()).add(websocket)
 
     # Register callback
     task_manager.register_callback(task_id, _sync_progress_callback)
@@ -82,7 +96,7 @@ async def websocket_upload_progress(websocket: WebSocket, task_id: str):
                 chunk_count=task.chunk_count,
                 error=task.error,
             )
-            await websocket.send_text(message.model_dump_json())
+            await websocket.send_text(_PROGRESS_SERIALIZER.to_json(message).decode())
 
         # Keep connection alive and handle incoming messages
         while True:
@@ -105,7 +119,7 @@ async def websocket_upload_progress(websocket: WebSocket, task_id: str):
                             message="使用者取消",
                         )
                     elif action == "ping":
-                        await websocket.send_text(json.dumps({"action": "pong"}))
+                        await websocket.send_text(_PONG_FRAME)
 
                 except json.JSONDecodeError:
                     pass
@@ -113,7 +127,7 @@ async def websocket_upload_progress(websocket: WebSocket, task_id: str):
             except asyncio.TimeoutError:
                 # Send heartbeat
                 try:
-                    await websocket.send_text(json.dumps({"heartbeat": True}))
+                    await websocket.send_text(_HEARTBEAT_FRAME)
                 except Exception:
                     break
 
@@ -134,19 +148,19 @@ async def websocket_upload_progress(websocket: WebSocket, task_id: str):
                     chunk_count=task.chunk_count,
                     error=task.error,
                 )
-                await websocket.send_text(final_message.model_dump_json())
+                await websocket.send_text(_PROGRESS_SERIALIZER.to_json(final_message).decode())
                 break
 
     except WebSocketDisconnect:
-        logger.info(f"WebSocket disconnected for task: {task_id}")
+        logger.info("WebSocket disconnected for task: %s", task_id)
     except Exception as e:
-        logger.error(f"WebSocket error for task {task_id}: {e}")
+        logger.error("WebSocket error for task %s: %s", task_id, e)
     finally:
         # Cleanup
-        if task_id in _active_connections:
-            if websocket in _active_connections[task_id]:
-                _active_connections[task_id].remove(websocket)
-            if not _active_connections[task_id]:
+        connections = _active_connections.get(task_id)
+        if connections is not None:
+            connections.discard(websocket)
+            if not connections:
                 del _active_connections[task_id]
 
         task_manager.unregister_callback(task_id, _sync_progress_callback)
@@ -158,6 +172,12 @@ async def websocket_all_tasks(websocket: WebSocket):
     await websocket.accept()
     logger.info("WebSocket connected for all tasks")
 
+    # Edge-triggered: task_manager sets the event on any task mutation,
+    # so idle periods cost nothing instead of a full re-serialize of the
+    # task list every 2 seconds per client.
+    subscription = task_manager.subscribe_changes()
+    _, changed = subscription
+
     try:
         while True:
             # Send current active tasks
@@ -176,12 +196,24 @@ async def websocket_all_tasks(websocket: WebSocket):
                 ],
                 "active_count": len(tasks),
             }
-            await websocket.send_text(json.dumps(message))
+            # orjson: C-level encode; decode() keeps it a text frame
+            # for browser clients
+            await websocket.send_text(orjson.dumps(message).decode())
 
-            # Wait before next update
-            await asyncio.sleep(2.0)
+            # Wait for the next change; the timeout doubles as a
+            # keep-alive refresh so stalled clients still get pruned
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=30.0)
+            except asyncio.TimeoutError:
+                continue
+            # Debounce: let a burst of updates coalesce into one frame
+            changed.clear()
+            await asyncio.sleep(0.2)
+            changed.clear()
 
     except WebSocketDisconnect:
         logger.info("WebSocket disconnected for all tasks")
     except Exception as e:
-        logger.error(f"WebSocket error for all tasks: {e}")
+        logger.error("WebSocket error for all tasks: %s", e)
+    finally:
+        task_manager.unsubscribe_changes(subscription)
@@ -1,7 +1,10 @@
 """Redis cache service for query results."""
+import asyncio
+import functools
 import hashlib
 import json
 import logging
+import time
 from typing import Optional, Any
 import redis
 
@@ -37,14 +40,14 @@ def get_redis_client() -> Optional[redis.Redis]:
             )
             # Test connection
             _redis_client.ping()
-            logger.info(f"Connected to Redis at {settings.redis_url}")
+            logger.info("Connected to Redis at %s", settings.redis_url)
         except redis.ConnectionError as e:
-            logger.warning(f"Failed to connect to Redis: {e}")
+            logger.warning("Failed to connect to Redis: %s", e)
             logger.info("Cache disabled - falling back to direct search")
             _cache_enabled = False
             _redis_client = None
         except Exception as e:
-            logger.error(f"Unexpected Redis error: {e}")
+            logger.error("Unexpected Redis error: %s", e)
             _cache_enabled = False
             _redis_client = None
 
@@ -80,6 +83,78 @@ def generate_cache_key(query: str, top_k: int) -> str:
     return f"query:{query_hash}:top_k:{top_k}"
 
 
+# Answers go stale faster than raw retrieval hits (prompt/model tweaks,
+# new documents), so they get a shorter TTL than the search cache.
+ANSWER_CACHE_TTL = 300
+
+
+def generate_answer_cache_key(
+    query: str, image_base64: Optional[str], top_k: int
+) -> str:
+    """Generate cache key for a full chat answer."""
+    normalized = normalize_query(query)
+    digest = hashlib.sha256(
+        normalized.encode("utf-8") + (image_base64 or "").encode("utf-8")
+    ).hexdigest()[:16]
+    # The query: prefix keeps answer entries inside the keyspace that
+    # invalidate_cache already clears on document changes.
+    return f"query:answer:{digest}:top_k:{top_k}"
+
+
+def get_cached_answer(
+    query: str, image_base64: Optional[str], top_k: int
+) -> Optional[dict]:
+    """Get a cached chat answer ({'answer', 'sources', 'follow_up'})."""
+    global _cache_stats
+
+    client = get_redis_client()
+    if client is None:
+        return None
+
+    cache_key = generate_answer_cache_key(query, image_base64, top_k)
+    try:
+        cached = client.get(cache_key)
+        if cached:
+            _cache_stats["hits"] += 1
+            logger.info("Answer cache HIT: query='%s...'", query[:50])
+            return json.loads(cached)
+        _cache_stats["misses"] += 1
+        return None
+    except Exception as e:
+        logger.error("Answer cache get error: %s", e)
+        _cache_stats["misses"] += 1
+        return None
+
+
+def set_cached_answer(
+    query: str,
+    image_base64: Optional[str],
+    top_k: int,
+    answer: str,
+    sources: list[dict],
+    follow_up: Optional[list[str]] = None,
+    ttl: int = ANSWER_CACHE_TTL,
+) -> bool:
+    """Cache a full chat answer with its wire-form sources."""
+    client = get_redis_client()
+    if client is None:
+        return False
+
+    cache_key = generate_answer_cache_key(query, image_base64, top_k)
+    try:
+        client.setex(
+            cache_key,
+            ttl,
+            json.dumps(
+                {"answer": answer, "sources": sources, "follow_up": follow_up}
+            ),
+        )
+        return True
+    except Exception as e:
+        logger.error("Answer cache set error: %s", e)
+        return False
+
+
 def get_cached_results(query: str, top_k: int) -> Optional[list[dict]]:
     """Get cached search results."""
     global _cache_stats
@@ -102,18 +177,19 @@ def get_cached_results(query: str, top_k: int) -> Optional[list[dict]]:
             client.hincrby(f"{cache_key}:meta", "hit_count", 1)
             results = json.loads(cached)
             logger.info(
-                f"Cache HIT: query='{query[:50]}...', "
-                f"results={len(results)}, latency={elapsed_ms:.1f}ms"
+                "Cache HIT: query='%s...', results=%d, latency=%.1fms",
+                query[:50], len(results), elapsed_ms,
             )
             return results
         else:
             _cache_stats["misses"] += 1
             logger.info(
-                f"Cache MISS: query='{query[:50]}...', latency={elapsed_ms:.1f}ms"
+                "Cache MISS: query='%s...', latency=%.1fms",
+                query[:50], elapsed_ms,
             )
             return None
     except Exception as e:
-        logger.error(f"Cache get error: {e}")
+        logger.error("Cache get error: %s", e)
         _cache_stats["misses"] += 1
         return None
 
@@ -150,10 +226,10 @@ def set_cached_results(
         })
         client.expire(meta_key, cache_ttl)
 
-        logger.debug(f"Cached results for query: {query[:50]}... (TTL: {cache_ttl}s)")
+        logger.debug("Cached results for query: %s... (TTL: %ss)", query[:50], cache_ttl)
         return True
     except Exception as e:
-        logger.error(f"Cache set error: {e}")
+        logger.error("Cache set error: %s", e)
         return False
 
 
@@ -196,10 +272,10 @@ def invalidate_cache(pattern: Optional[str] = None, document_id: Optional[str] =
                 if cursor == 0:
                     break
 
-        logger.info(f"Invalidated {deleted} cache entries")
+        logger.info("Invalidated %s cache entries", deleted)
         return deleted
     except Exception as e:
-        logger.error(f"Cache invalidation error: {e}")
+        logger.error("Cache invalidation error: %s", e)
         return 0
 
 
@@ -258,10 +334,104 @@ def get_cache_stats() -> dict:
 
         return stats
     except Exception as e:
-        logger.error(f"Error getting cache stats: {e}")
+        logger.error("Error getting cache stats: %s", e)
         return stats
 
 
 def clear_all_cache() -> int:
     """Clear all cache entries."""
     return invalidate_cache(pattern="*")
+
+
+# In-flight cold-miss computations, one task per cache key. Concurrent
+# misses for the same key (thundering herd after a TTL expiry) await a
+# single handler run instead of each hitting the DB.
+_inflight: dict[str, "asyncio.Task"] = {}
+
+
+def cache_response(key_template: str, ttl: int = 60, swr: int = 30):
+    """
+    Stale-while-revalidate response cache for read-heavy async endpoints.
+
+    The decorated handler's JSON-serializable return value is cached
+    under key_template.format(**kwargs). Within ttl seconds a hit is
+    served straight from Redis; between ttl and ttl+swr the stale value
+    is returned immediately while one background task refreshes the
+    entry, so callers never wait on the DB once the cache is warm. Cold
+    misses are single-flighted per key within the process. With Redis
+    down the handler runs normally.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            client = get_redis_client()
+            if client is None:
+                return await func(*args, **kwargs)
+
+            key = "resp:" + key_template.format(**kwargs)
+            try:
+                cached = await asyncio.to_thread(client.get, key)
+            except Exception as e:
+                logger.error("Response cache get error: %s", e)
+                cached = None
+
+            if cached:
+                entry = json.loads(cached)
+                if time.time() >= entry["fresh_until"]:
+                    # Stale: serve it now, refresh once in the background
+                    asyncio.create_task(_refresh(func, key, args, kwargs, ttl, swr))
+                return entry["data"]
+
+            # Cold miss: join the in-flight computation for this key if
+            # one exists, otherwise start it. shield() keeps the shared
+            # task alive when an individual waiter disconnects.
+            task = _inflight.get(key)
+            if task is None:
+                task = asyncio.create_task(
+                    _compute_response(func, key, args, kwargs, ttl, swr)
+                )
+                _inflight[key] = task
+                task.add_done_callback(lambda _t: _inflight.pop(key, None))
+            return await asyncio.shield(task)
+
+        return wrapper
+
+    async def _refresh(func, key, args, kwargs, ttl, swr):
+        client = get_redis_client()
+        if client is None:
+            return
+        try:
+            # NX lock so concurrent stale hits trigger a single refresh
+            locked = await asyncio.to_thread(
+                client.set, f"{key}:refresh", "1", nx=True, ex=30
+            )
+            if not locked:
+                return
+            data = await func(*args, **kwargs)
+            await asyncio.to_thread(_store_response, key, data, ttl, swr)
+        except Exception as e:
+            logger.error("Response cache refresh error: %s", e)
+
+    return decorator
+
+
+async def _compute_response(func, key, args, kwargs, ttl, swr):
+    """Run the handler once for all concurrent waiters and store it."""
+    data = await func(*args, **kwargs)
+    await asyncio.to_thread(_store_response, key, data, ttl, swr)
+    return data
+
+
+def _store_response(key: str, data, ttl: int, swr: int) -> None:
+    """Store a response entry with its freshness deadline."""
+    client = get_redis_client()
+    if client is None:
+        return
+    try:
+        client.setex(
+            key,
+            ttl + swr,
+            json.dumps({"data": data, "fresh_until": time.time() + ttl}),
+        )
+    except Exception as e:
+        logger.error("Response cache set error: %s", e)
@@ -2,6 +2,8 @@
 Dashboard Service - Statistics and aggregations for dashboard.
 """
 
+import asyncio
+import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime, date, timedelta
 from dataclasses import dataclass
@@ -9,7 +11,35 @@ from dataclasses import dataclass
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db_context
+from app.db.session import engine, get_read_db_context
+
+logger = logging.getLogger(__name__)
+
+# How often the vehicle_summary materialized view is refreshed; rollups
+# served from it are at most this stale.
+SUMMARY_REFRESH_INTERVAL = 300
+
+
+async def refresh_vehicle_summary_loop() -> None:
+    """Periodically refresh the vehicle_summary materialized view.
+
+    The fault ranking reads the view instead of aggregating over the
+    history tables live. CONCURRENTLY (backed by the unique index on id)
+    keeps readers unblocked during the refresh; it cannot run inside a
+    transaction block, hence the autocommit connection.
+    """
+    while True:
+        try:
+            async with engine.connect() as conn:
+                await conn.execution_options(isolation_level="AUTOCOMMIT")
+                await conn.execute(
+                    text("REFRESH MATERIALIZED VIEW CONCURRENTLY vehicle_summary")
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("vehicle_summary refresh failed: %s", e)
+        await asyncio.sleep(SUMMARY_REFRESH_INTERVAL)
 
 
 @dataclass
@@ -76,10 +106,10 @@ class DashboardService:
         inventory_stats AS (
             SELECT COUNT(*) as low_stock_items
             FROM parts_inventory
-            WHERE quantity_on_hand <= minimum_quantity
+            WHERE is_low_stock
         ),
         cost_stats AS (
-            SELECT COALESCE(SUM(amount), 0) as total_cost_this_month
+            SELECT COALESCE(SUM(amount), 0) / 100.0 as total_cost_this_month
             FROM cost_records
             WHERE record_date >= DATE_TRUNC('month', CURRENT_DATE)
         )
@@ -95,7 +125,7 @@ class DashboardService:
         FROM vehicle_stats v, fault_stats f, maintenance_stats m, inventory_stats i, cost_stats c
         """
         
-        async with get_db_context() as session:
+        async with get_read_db_context() as session:
             result = await session.execute(text(sql))
             row = result.fetchone()
             
@@ -135,7 +165,7 @@ class DashboardService:
         ORDER BY date DESC, count DESC
         """
         
-        async with get_db_context() as session:
+        async with get_read_db_context() as session:
             result = await session.execute(text(sql))
             rows = result.fetchall()
             
@@ -153,14 +183,14 @@ class DashboardService:
         sql = f"""
         SELECT 
             cost_type,
-            SUM(amount) as amount
+            SUM(amount) / 100.0 as amount
         FROM cost_records
         WHERE record_date >= DATE_TRUNC('month', CURRENT_DATE) - INTERVAL '{months} months'
         GROUP BY cost_type
         ORDER BY amount DESC
         """
         
-        async with get_db_context() as session:
+        async with get_read_db_context() as session:
             result = await session.execute(text(sql))
             rows = result.fetchall()
             
@@ -176,22 +206,22 @@ class DashboardService:
             ]
     
     async def get_vehicle_fault_ranking(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get vehicles ranked by fault count"""
+        """Get vehicles ranked by fault count (90-day window)"""
+        # Served from the vehicle_summary materialized view - O(vehicles)
+        # per request instead of re-aggregating fault history live; the
+        # background refresh loop bounds staleness to one interval.
         sql = f"""
-        SELECT 
-            v.vehicle_code,
-            v.vehicle_type,
-            COUNT(f.id) as fault_count,
-            COUNT(f.id) FILTER (WHERE f.status = 'open') as open_faults
-        FROM vehicles v
-        LEFT JOIN fault_records f ON v.id = f.vehicle_id
-            AND f.fault_date >= NOW() - INTERVAL '90 days'
-        GROUP BY v.id, v.vehicle_code, v.vehicle_type
+        SELECT
+            vehicle_code,
+            vehicle_type,
+            faults_90d as fault_count,
+            open_faults
+        FROM vehicle_summary
         ORDER BY fault_count DESC
         LIMIT {limit}
         """
         
-        async with get_db_context() as session:
+        async with get_read_db_context() as session:
             result = await session.execute(text(sql))
             rows = result.fetchall()
             
@@ -216,11 +246,11 @@ class DashboardService:
             minimum_quantity,
             (minimum_quantity - quantity_on_hand) as shortage
         FROM parts_inventory
-        WHERE quantity_on_hand <= minimum_quantity
+        WHERE is_low_stock
         ORDER BY shortage DESC
         """
         
-        async with get_db_context() as session:
+        async with get_read_db_context() as session:
             result = await session.execute(text(sql))
             rows = result.fetchall()
             
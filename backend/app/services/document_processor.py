@@ -24,6 +24,34 @@ logger = logging.getLogger(__name__)
 # Progress callback type: (step, progress_percent, message, chunk_count)
 ProgressCallback = Callable[[ProcessingStep, int, str, Optional[int]], None]
 
+# Cap stored chunk images. Extracted figures are only used for CLIP
+# embedding, GPT-4o prompting and on-screen display, none of which need
+# print-resolution originals; downscaling and re-encoding shrinks the
+# base64 payloads Qdrant stores and the image endpoint serves.
+MAX_IMAGE_DIMENSION = 1024
+
+
+def _normalize_image(image_bytes: bytes) -> bytes:
+    """Downscale and re-encode an extracted image as optimized JPEG.
+
+    thumbnail() only shrinks, preserving aspect ratio; LANCZOS keeps
+    edges sharp at the reduced size. Bytes Pillow cannot parse are
+    stored as-is.
+    """
+    try:
+        img = Image.open(io.BytesIO(image_bytes))
+        img.thumbnail(
+            (MAX_IMAGE_DIMENSION, MAX_IMAGE_DIMENSION),
+            Image.Resampling.LANCZOS,
+        )
+        out = io.BytesIO()
+        img.convert("RGB").save(
+            out, "JPEG", quality=85, optimize=True, progressive=True
+        )
+        return out.getvalue()
+    except Exception:
+        return image_bytes
+
 
 async def process_pdf(
     file_content: bytes,
@@ -46,7 +74,6 @@ async def process_pdf(
     Returns: (document_id, chunk_count)
     """
     document_id = str(uuid.uuid4())
-    chunk_count = 0
 
     def emit_progress(step: ProcessingStep, progress: int, message: str, chunks: Optional[int] = None):
         if progress_callback:
@@ -55,111 +82,121 @@ async def process_pdf(
             except Exception as e:
                 logger.warning(f"Progress callback error: {e}")
 
-    images_data = []
+    def _process() -> int:
+        """Blocking parse/chunk/embed/store pipeline, run off the loop."""
+        chunk_count = 0
+        images_data = []
 
-    # Save original file to storage
-    try:
-        file_storage.save_file(document_id, filename, file_content)
-        logger.info(f"Saved original file for document {document_id}")
-    except Exception as e:
-        logger.warning(f"Failed to save original file: {e}")
-
-    # Step 1: Parsing (0-25%)
-    emit_progress(ProcessingStep.PARSING, 0, "開始解析 PDF 文件...")
-
-    # Extract all text using pdfplumber
-    full_text = ""
-    with pdfplumber.open(io.BytesIO(file_content)) as pdf:
-        total_pages = len(pdf.pages)
-        for page_num, page in enumerate(pdf.pages):
-            text = page.extract_text() or ""
-            if text.strip():
-                full_text += text + "\n\n"
-            # Progress: 0-20% for text extraction
-            page_progress = int((page_num + 1) / total_pages * 20)
-            emit_progress(ProcessingStep.PARSING, page_progress, f"解析頁面 {page_num + 1}/{total_pages}...")
-
-    # Extract images using PyMuPDF (20-25%)
-    emit_progress(ProcessingStep.PARSING, 20, "提取圖片中...")
-    doc = fitz.open(stream=file_content, filetype="pdf")
-    for page_num in range(len(doc)):
-        page = doc[page_num]
-        image_list = page.get_images()
-        for img_index, img in enumerate(image_list):
+        # Save original file to storage
+        try:
+            file_storage.save_file(document_id, filename, file_content)
+            logger.info(f"Saved original file for document {document_id}")
+        except Exception as e:
+            logger.warning(f"Failed to save original file: {e}")
+
+        # Step 1: Parsing (0-25%)
+        emit_progress(ProcessingStep.PARSING, 0, "開始解析 PDF 文件...")
+
+        # Extract all text using pdfplumber
+        full_text = ""
+        with pdfplumber.open(io.BytesIO(file_content)) as pdf:
+            total_pages = len(pdf.pages)
+            for page_num, page in enumerate(pdf.pages):
+                text = page.extract_text() or ""
+                if text.strip():
+                    full_text += text + "\n\n"
+                # Progress: 0-20% for text extraction
+                page_progress = int((page_num + 1) / total_pages * 20)
+                emit_progress(ProcessingStep.PARSING, page_progress, f"解析頁面 {page_num + 1}/{total_pages}...")
+
+        # Extract images using PyMuPDF (20-25%)
+        emit_progress(ProcessingStep.PARSING, 20, "提取圖片中...")
+        doc = fitz.open(stream=file_content, filetype="pdf")
+        for page_num in range(len(doc)):
+            page = doc[page_num]
+            image_list = page.get_images()
+            for img_index, img in enumerate(image_list):
+                try:
+                    xref = img[0]
+                    base_image = doc.extract_image(xref)
+                    image_bytes = _normalize_image(base_image["image"])
+
+                    # Convert to base64
+                    image_base64 = base64.b64encode(image_bytes).decode("utf-8")
+                    images_data.append({
+                        "base64": image_base64,
+                        "page": page_num + 1,
+                    })
+                except Exception:
+                    continue
+        doc.close()
+        emit_progress(ProcessingStep.PARSING, 25, f"解析完成，找到 {len(images_data)} 張圖片")
+
+        # Step 2: Chunking (25-50%)
+        emit_progress(ProcessingStep.CHUNKING, 25, "文件分塊中...")
+
+        # Use smart chunking for technical documents
+        if use_smart_chunking and full_text.strip():
+            chunks = smart_chunk(full_text, chunk_size=500, overlap=100)
+        else:
+            # Fallback to simple paragraph chunking
+            chunks = [
+                {"content": p.strip(), "metadata": {}}
+                for p in full_text.split("\n\n")
+                if p.strip() and len(p.strip()) > 30
+            ]
+
+        total_items = len(chunks) + len(images_data)
+        emit_progress(ProcessingStep.CHUNKING, 50, f"分塊完成，共 {len(chunks)} 個文字區塊", len(chunks))
+
+        # Step 3: Embedding (50-90%)
+        emit_progress(ProcessingStep.EMBEDDING, 50, "向量化文字區塊中...")
+
+        # Process text chunks with metadata
+        if chunks:
+            contents = [c["content"] for c in chunks]
+            embeddings = embed_service.embed_texts(contents)
+            for idx, (chunk, emb) in enumerate(zip(chunks, embeddings)):
+                vector_store.add_text_chunk(
+                    document_id=document_id,
+                    document_name=filename,
+                    content=chunk["content"],
+                    embedding=emb,
+                    chunk_index=idx,
+                    metadata=chunk.get("metadata", {}),
+                )
+                chunk_count += 1
+                # Progress: 50-75% for text embedding
+                if total_items > 0:
+                    embed_progress = 50 + int((idx + 1) / total_items * 25)
+                    emit_progress(ProcessingStep.EMBEDDING, embed_progress, f"向量化文字 {idx + 1}/{len(chunks)}...", chunk_count)
+
+        # Process images using Jina CLIP API (75-90%)
+        emit_progress(ProcessingStep.EMBEDDING, 75, "向量化圖片中...")
+        for img_idx, img_data in enumerate(images_data):
             try:
-                xref = img[0]
-                base_image = doc.extract_image(xref)
-                image_bytes = base_image["image"]
-
-                # Convert to base64
-                image_base64 = base64.b64encode(image_bytes).decode("utf-8")
-                images_data.append({
-                    "base64": image_base64,
-                    "page": page_num + 1,
-                })
+                emb = embed_service.embed_image_from_base64(img_data["base64"])
+                vector_store.add_image_chunk(
+                    document_id=document_id,
+                    document_name=filename,
+                    image_base64=img_data["base64"],
+                    embedding=emb,
+                    description=f"Image from page {img_data['page']}",
+                )
+                chunk_count += 1
+                # Progress: 75-90% for image embedding
+                if images_data:
+                    img_progress = 75 + int((img_idx + 1) / len(images_data) * 15)
+                    emit_progress(ProcessingStep.EMBEDDING, img_progress, f"向量化圖片 {img_idx + 1}/{len(images_data)}...", chunk_count)
             except Exception:
                 continue
-    doc.close()
-    emit_progress(ProcessingStep.PARSING, 25, f"解析完成，找到 {len(images_data)} 張圖片")
-
-    # Step 2: Chunking (25-50%)
-    emit_progress(ProcessingStep.CHUNKING, 25, "文件分塊中...")
-
-    # Use smart chunking for technical documents
-    if use_smart_chunking and full_text.strip():
-        chunks = smart_chunk(full_text, chunk_size=500, overlap=100)
-    else:
-        # Fallback to simple paragraph chunking
-        chunks = [
-            {"content": p.strip(), "metadata": {}}
-            for p in full_text.split("\n\n")
-            if p.strip() and len(p.strip()) > 30
-        ]
-
-    total_items = len(chunks) + len(images_data)
-    emit_progress(ProcessingStep.CHUNKING, 50, f"分塊完成，共 {len(chunks)} 個文字區塊", len(chunks))
-
-    # Step 3: Embedding (50-90%)
-    emit_progress(ProcessingStep.EMBEDDING, 50, "向量化文字區塊中...")
-
-    # Process text chunks with metadata
-    if chunks:
-        contents = [c["content"] for c in chunks]
-        embeddings = embed_service.embed_texts(contents)
-        for idx, (chunk, emb) in enumerate(zip(chunks, embeddings)):
-            vector_store.add_text_chunk(
-                document_id=document_id,
-                document_name=filename,
-                content=chunk["content"],
-                embedding=emb,
-                chunk_index=idx,
-                metadata=chunk.get("metadata", {}),
-            )
-            chunk_count += 1
-            # Progress: 50-75% for text embedding
-            if total_items > 0:
-                embed_progress = 50 + int((idx + 1) / total_items * 25)
-                emit_progress(ProcessingStep.EMBEDDING, embed_progress, f"向量化文字 {idx + 1}/{len(chunks)}...", chunk_count)
-
-    # Process images using Jina CLIP API (75-90%)
-    emit_progress(ProcessingStep.EMBEDDING, 75, "向量化圖片中...")
-    for img_idx, img_data in enumerate(images_data):
-        try:
-            emb = embed_service.embed_image_from_base64(img_data["base64"])
-            vector_store.add_image_chunk(
-                document_id=document_id,
-                document_name=filename,
-                image_base64=img_data["base64"],
-                embedding=emb,
-                description=f"Image from page {img_data['page']}",
-            )
-            chunk_count += 1
-            # Progress: 75-90% for image embedding
-            if images_data:
-                img_progress = 75 + int((img_idx + 1) / len(images_data) * 15)
-                emit_progress(ProcessingStep.EMBEDDING, img_progress, f"向量化圖片 {img_idx + 1}/{len(images_data)}...", chunk_count)
-        except Exception:
-            continue
+
+        return chunk_count
+
+    # The whole parse/embed/store pipeline is synchronous C-extension
+    # and network-client code; on a worker thread it no longer pins the
+    # event loop for the duration of an upload.
+    chunk_count = await asyncio.to_thread(_process)
 
     # Step 4: Indexing (90-100%)
     emit_progress(ProcessingStep.INDEXING, 90, "建立索引中...")
@@ -196,7 +233,6 @@ async def process_word(
     Returns: (document_id, chunk_count)
     """
     document_id = str(uuid.uuid4())
-    chunk_count = 0
 
     def emit_progress(step: ProcessingStep, progress: int, message: str, chunks: Optional[int] = None):
         if progress_callback:
@@ -205,117 +241,126 @@ async def process_word(
             except Exception as e:
                 logger.warning(f"Progress callback error: {e}")
 
-    images_data = []
+    def _process() -> int:
+        """Blocking parse/chunk/embed/store pipeline, run off the loop."""
+        chunk_count = 0
+        images_data = []
 
-    # Save original file to storage
-    try:
-        file_storage.save_file(document_id, filename, file_content)
-        logger.info(f"Saved original file for document {document_id}")
-    except Exception as e:
-        logger.warning(f"Failed to save original file: {e}")
-
-    # Step 1: Parsing (0-25%)
-    emit_progress(ProcessingStep.PARSING, 0, "開始解析 Word 文件...")
-
-    # Extract text from Word document
-    doc = DocxDocument(io.BytesIO(file_content))
-
-    # Collect all text
-    full_text = ""
-    paragraphs = doc.paragraphs
-    total_paras = len(paragraphs)
-    for para_idx, para in enumerate(paragraphs):
-        text = para.text.strip()
-        if text:
-            full_text += text + "\n"
-        # Progress: 0-15% for paragraph extraction
-        if total_paras > 0:
-            para_progress = int((para_idx + 1) / total_paras * 15)
-            emit_progress(ProcessingStep.PARSING, para_progress, f"解析段落 {para_idx + 1}/{total_paras}...")
-
-    # Extract tables (15-20%)
-    emit_progress(ProcessingStep.PARSING, 15, "解析表格中...")
-    for table in doc.tables:
-        table_text = []
-        for row in table.rows:
-            row_text = [cell.text.strip() for cell in row.cells]
-            if any(row_text):
-                table_text.append(" | ".join(row_text))
-        if table_text:
-            full_text += "\n" + "\n".join(table_text) + "\n"
-
-    # Extract images from Word document (20-25%)
-    emit_progress(ProcessingStep.PARSING, 20, "提取圖片中...")
-    for rel in doc.part.rels.values():
-        if "image" in rel.reltype:
+        # Save original file to storage
+        try:
+            file_storage.save_file(document_id, filename, file_content)
+            logger.info(f"Saved original file for document {document_id}")
+        except Exception as e:
+            logger.warning(f"Failed to save original file: {e}")
+
+        # Step 1: Parsing (0-25%)
+        emit_progress(ProcessingStep.PARSING, 0, "開始解析 Word 文件...")
+
+        # Extract text from Word document
+        doc = DocxDocument(io.BytesIO(file_content))
+
+        # Collect all text
+        full_text = ""
+        paragraphs = doc.paragraphs
+        total_paras = len(paragraphs)
+        for para_idx, para in enumerate(paragraphs):
+            text = para.text.strip()
+            if text:
+                full_text += text + "\n"
+            # Progress: 0-15% for paragraph extraction
+            if total_paras > 0:
+                para_progress = int((para_idx + 1) / total_paras * 15)
+                emit_progress(ProcessingStep.PARSING, para_progress, f"解析段落 {para_idx + 1}/{total_paras}...")
+
+        # Extract tables (15-20%)
+        emit_progress(ProcessingStep.PARSING, 15, "解析表格中...")
+        for table in doc.tables:
+            table_text = []
+            for row in table.rows:
+                row_text = [cell.text.strip() for cell in row.cells]
+                if any(row_text):
+                    table_text.append(" | ".join(row_text))
+            if table_text:
+                full_text += "\n" + "\n".join(table_text) + "\n"
+
+        # Extract images from Word document (20-25%)
+        emit_progress(ProcessingStep.PARSING, 20, "提取圖片中...")
+        for rel in doc.part.rels.values():
+            if "image" in rel.reltype:
+                try:
+                    image_bytes = _normalize_image(rel.target_part.blob)
+                    image_base64 = base64.b64encode(image_bytes).decode("utf-8")
+                    images_data.append({
+                        "base64": image_base64,
+                    })
+                except Exception:
+                    continue
+        emit_progress(ProcessingStep.PARSING, 25, f"解析完成，找到 {len(images_data)} 張圖片")
+
+        # Step 2: Chunking (25-50%)
+        emit_progress(ProcessingStep.CHUNKING, 25, "文件分塊中...")
+
+        # Use smart chunking
+        if use_smart_chunking and full_text.strip():
+            chunks = smart_chunk(full_text, chunk_size=500, overlap=100)
+        else:
+            # Fallback
+            chunks = [
+                {"content": p.strip(), "metadata": {}}
+                for p in full_text.split("\n\n")
+                if p.strip() and len(p.strip()) > 30
+            ]
+
+        total_items = len(chunks) + len(images_data)
+        emit_progress(ProcessingStep.CHUNKING, 50, f"分塊完成，共 {len(chunks)} 個文字區塊", len(chunks))
+
+        # Step 3: Embedding (50-90%)
+        emit_progress(ProcessingStep.EMBEDDING, 50, "向量化文字區塊中...")
+
+        # Process text chunks with metadata
+        if chunks:
+            contents = [c["content"] for c in chunks]
+            embeddings = embed_service.embed_texts(contents)
+            for idx, (chunk, emb) in enumerate(zip(chunks, embeddings)):
+                vector_store.add_text_chunk(
+                    document_id=document_id,
+                    document_name=filename,
+                    content=chunk["content"],
+                    embedding=emb,
+                    chunk_index=idx,
+                    metadata=chunk.get("metadata", {}),
+                )
+                chunk_count += 1
+                # Progress: 50-75% for text embedding
+                if total_items > 0:
+                    embed_progress = 50 + int((idx + 1) / total_items * 25)
+                    emit_progress(ProcessingStep.EMBEDDING, embed_progress, f"向量化文字 {idx + 1}/{len(chunks)}...", chunk_count)
+
+        # Process images using Jina CLIP API (75-90%)
+        emit_progress(ProcessingStep.EMBEDDING, 75, "向量化圖片中...")
+        for img_idx, img_data in enumerate(images_data):
             try:
-                image_bytes = rel.target_part.blob
-                image_base64 = base64.b64encode(image_bytes).decode("utf-8")
-                images_data.append({
-                    "base64": image_base64,
-                })
+                emb = embed_service.embed_image_from_base64(img_data["base64"])
+                vector_store.add_image_chunk(
+                    document_id=document_id,
+                    document_name=filename,
+                    image_base64=img_data["base64"],
+                    embedding=emb,
+                    description=f"Image from {filename}",
+                )
+                chunk_count += 1
+                # Progress: 75-90% for image embedding
+                if images_data:
+                    img_progress = 75 + int((img_idx + 1) / len(images_data) * 15)
+                    emit_progress(ProcessingStep.EMBEDDING, img_progress, f"向量化圖片 {img_idx + 1}/{len(images_data)}...", chunk_count)
             except Exception:
                 continue
-    emit_progress(ProcessingStep.PARSING, 25, f"解析完成，找到 {len(images_data)} 張圖片")
-
-    # Step 2: Chunking (25-50%)
-    emit_progress(ProcessingStep.CHUNKING, 25, "文件分塊中...")
-
-    # Use smart chunking
-    if use_smart_chunking and full_text.strip():
-        chunks = smart_chunk(full_text, chunk_size=500, overlap=100)
-    else:
-        # Fallback
-        chunks = [
-            {"content": p.strip(), "metadata": {}}
-            for p in full_text.split("\n\n")
-            if p.strip() and len(p.strip()) > 30
-        ]
-
-    total_items = len(chunks) + len(images_data)
-    emit_progress(ProcessingStep.CHUNKING, 50, f"分塊完成，共 {len(chunks)} 個文字區塊", len(chunks))
-
-    # Step 3: Embedding (50-90%)
-    emit_progress(ProcessingStep.EMBEDDING, 50, "向量化文字區塊中...")
-
-    # Process text chunks with metadata
-    if chunks:
-        contents = [c["content"] for c in chunks]
-        embeddings = embed_service.embed_texts(contents)
-        for idx, (chunk, emb) in enumerate(zip(chunks, embeddings)):
-            vector_store.add_text_chunk(
-                document_id=document_id,
-                document_name=filename,
-                content=chunk["content"],
-                embedding=emb,
-                chunk_index=idx,
-                metadata=chunk.get("metadata", {}),
-            )
-            chunk_count += 1
-            # Progress: 50-75% for text embedding
-            if total_items > 0:
-                embed_progress = 50 + int((idx + 1) / total_items * 25)
-                emit_progress(ProcessingStep.EMBEDDING, embed_progress, f"向量化文字 {idx + 1}/{len(chunks)}...", chunk_count)
-
-    # Process images using Jina CLIP API (75-90%)
-    emit_progress(ProcessingStep.EMBEDDING, 75, "向量化圖片中...")
-    for img_idx, img_data in enumerate(images_data):
-        try:
-            emb = embed_service.embed_image_from_base64(img_data["base64"])
-            vector_store.add_image_chunk(
-                document_id=document_id,
-                document_name=filename,
-                image_base64=img_data["base64"],
-                embedding=emb,
-                description=f"Image from {filename}",
-            )
-            chunk_count += 1
-            # Progress: 75-90% for image embedding
-            if images_data:
-                img_progress = 75 + int((img_idx + 1) / len(images_data) * 15)
-                emit_progress(ProcessingStep.EMBEDDING, img_progress, f"向量化圖片 {img_idx + 1}/{len(images_data)}...", chunk_count)
-        except Exception:
-            continue
+
+        return chunk_count
+
+    # Off the loop: pdfplumber/python-docx parsing, Pillow re-encode and
+    # the embedding/upsert loops all block
+    chunk_count = await asyncio.to_thread(_process)
 
     # Step 4: Indexing (90-100%)
     emit_progress(ProcessingStep.INDEXING, 90, "建立索引中...")
@@ -358,41 +403,48 @@ async def process_image(
             except Exception as e:
                 logger.warning(f"Progress callback error: {e}")
 
-    # Save original file to storage
-    try:
-        file_storage.save_file(document_id, filename, file_content)
-        logger.info(f"Saved original file for document {document_id}")
-    except Exception as e:
-        logger.warning(f"Failed to save original file: {e}")
+    def _process() -> None:
+        """Blocking normalize/embed/store pipeline, run off the loop."""
+        # Save original file to storage
+        try:
+            file_storage.save_file(document_id, filename, file_content)
+            logger.info(f"Saved original file for document {document_id}")
+        except Exception as e:
+            logger.warning(f"Failed to save original file: {e}")
 
-    # Step 1: Parsing (0-25%)
-    emit_progress(ProcessingStep.PARSING, 0, "開始處理圖片...")
+        # Step 1: Parsing (0-25%)
+        emit_progress(ProcessingStep.PARSING, 0, "開始處理圖片...")
 
-    # Convert to base64
-    image_base64 = base64.b64encode(file_content).decode("utf-8")
-    emit_progress(ProcessingStep.PARSING, 25, "圖片解析完成")
+        # Normalize and convert to base64 (the original is kept in storage)
+        image_bytes = _normalize_image(file_content)
+        image_base64 = base64.b64encode(image_bytes).decode("utf-8")
+        emit_progress(ProcessingStep.PARSING, 25, "圖片解析完成")
 
-    # Step 2: Chunking - minimal for images (25-50%)
-    emit_progress(ProcessingStep.CHUNKING, 50, "圖片準備完成", 1)
+        # Step 2: Chunking - minimal for images (25-50%)
+        emit_progress(ProcessingStep.CHUNKING, 50, "圖片準備完成", 1)
 
-    # Step 3: Embedding (50-90%)
-    emit_progress(ProcessingStep.EMBEDDING, 50, "向量化圖片中...")
+        # Step 3: Embedding (50-90%)
+        emit_progress(ProcessingStep.EMBEDDING, 50, "向量化圖片中...")
 
-    # Embed image using Jina CLIP API
-    emb = embed_service.embed_image_from_bytes(file_content)
+        # Embed image using Jina CLIP API (normalized bytes: smaller
+        # upload, same embedding quality at CLIP's input resolution)
+        emb = embed_service.embed_image_from_bytes(image_bytes)
 
-    emit_progress(ProcessingStep.EMBEDDING, 75, "向量化完成")
+        emit_progress(ProcessingStep.EMBEDDING, 75, "向量化完成")
 
-    # Store in vector store
-    vector_store.add_image_chunk(
-        document_id=document_id,
-        document_name=filename,
-        image_base64=image_base64,
-        embedding=emb,
-        description=f"Uploaded image: {filename}",
-    )
+        # Store in vector store
+        vector_store.add_image_chunk(
+            document_id=document_id,
+            document_name=filename,
+            image_base64=image_base64,
+            embedding=emb,
+            description=f"Uploaded image: {filename}",
+        )
+
+        emit_progress(ProcessingStep.EMBEDDING, 90, "圖片已儲存", 1)
 
-    emit_progress(ProcessingStep.EMBEDDING, 90, "圖片已儲存", 1)
+    # Off the loop: Pillow re-encode, embedding HTTP call and upsert
+    await asyncio.to_thread(_process)
 
     # Step 4: Indexing (90-100%)
     emit_progress(ProcessingStep.INDEXING, 90, "建立索引中...")
@@ -432,7 +484,6 @@ async def process_excel(
     Returns: (document_id, chunk_count)
     """
     document_id = str(uuid.uuid4())
-    chunk_count = 0
 
     def emit_progress(step: ProcessingStep, progress: int, message: str, chunks: Optional[int] = None):
         if progress_callback:
@@ -441,147 +492,156 @@ async def process_excel(
             except Exception as e:
                 logger.warning(f"Progress callback error: {e}")
 
-    # Save original file to storage
-    try:
-        file_storage.save_file(document_id, filename, file_content)
-        logger.info(f"Saved original file for document {document_id}")
-    except Exception as e:
-        logger.warning(f"Failed to save original file: {e}")
-
-    # Step 1: Parsing (0-25%)
-    emit_progress(ProcessingStep.PARSING, 0, "開始解析 Excel 文件...")
-
-    sheets_data = []
-    is_xlsx = filename.lower().endswith(".xlsx")
-
-    if is_xlsx:
-        # Process .xlsx with openpyxl
-        wb = load_workbook(io.BytesIO(file_content), data_only=True)
-        sheet_names = wb.sheetnames
-        total_sheets = len(sheet_names)
-
-        for sheet_idx, sheet_name in enumerate(sheet_names):
-            ws = wb[sheet_name]
-            rows = []
-
-            for row in ws.iter_rows(values_only=True):
-                # Convert None values to empty strings
-                row_values = [str(cell) if cell is not None else "" for cell in row]
-                if any(v.strip() for v in row_values):  # Skip completely empty rows
-                    rows.append(row_values)
-
-            if rows:
-                sheets_data.append({
-                    "name": sheet_name,
-                    "rows": rows,
-                })
-
-            # Progress: 0-20% for parsing
-            parse_progress = int((sheet_idx + 1) / total_sheets * 20)
-            emit_progress(ProcessingStep.PARSING, parse_progress, f"解析工作表 {sheet_idx + 1}/{total_sheets}: {sheet_name}...")
-
-        wb.close()
-    else:
-        # Process .xls with xlrd
-        wb = xlrd.open_workbook(file_contents=file_content)
-        total_sheets = wb.nsheets
-
-        for sheet_idx in range(total_sheets):
-            ws = wb.sheet_by_index(sheet_idx)
-            sheet_name = ws.name
-            rows = []
-
-            for row_idx in range(ws.nrows):
-                row_values = [str(ws.cell_value(row_idx, col_idx)) for col_idx in range(ws.ncols)]
-                if any(v.strip() for v in row_values):  # Skip completely empty rows
-                    rows.append(row_values)
-
-            if rows:
-                sheets_data.append({
-                    "name": sheet_name,
-                    "rows": rows,
-                })
-
-            # Progress: 0-20% for parsing
-            parse_progress = int((sheet_idx + 1) / total_sheets * 20)
-            emit_progress(ProcessingStep.PARSING, parse_progress, f"解析工作表 {sheet_idx + 1}/{total_sheets}: {sheet_name}...")
-
-    emit_progress(ProcessingStep.PARSING, 25, f"解析完成，共 {len(sheets_data)} 個工作表")
-
-    # Step 2: Chunking (25-50%)
-    emit_progress(ProcessingStep.CHUNKING, 25, "文件分塊中...")
-
-    chunks = []
-    for sheet in sheets_data:
-        sheet_name = sheet["name"]
-        rows = sheet["rows"]
-
-        if not rows:
-            continue
-
-        # Convert rows to structured text format (markdown table style)
-        # First row is treated as header
-        header = rows[0] if rows else []
-        data_rows = rows[1:] if len(rows) > 1 else []
-
-        # Build structured text for the sheet
-        sheet_text_parts = []
-        sheet_text_parts.append(f"## 工作表: {sheet_name}\n")
-
-        if header:
-            # Create markdown table header
-            header_line = "| " + " | ".join(header) + " |"
-            separator = "| " + " | ".join(["---"] * len(header)) + " |"
-            sheet_text_parts.append(header_line)
-            sheet_text_parts.append(separator)
-
-        # Add data rows
-        for row in data_rows:
-            # Ensure row has same number of columns as header
-            padded_row = row + [""] * (len(header) - len(row)) if len(row) < len(header) else row[:len(header)]
-            row_line = "| " + " | ".join(padded_row) + " |"
-            sheet_text_parts.append(row_line)
-
-        sheet_text = "\n".join(sheet_text_parts)
-
-        # Smart chunking or fallback
-        if use_smart_chunking and sheet_text.strip():
-            sheet_chunks = smart_chunk(sheet_text, chunk_size=500, overlap=100)
-            for chunk in sheet_chunks:
-                chunk["metadata"]["sheet_name"] = sheet_name
-                chunks.append(chunk)
+    def _process() -> int:
+        """Blocking parse/chunk/embed/store pipeline, run off the loop."""
+        chunk_count = 0
+
+        # Save original file to storage
+        try:
+            file_storage.save_file(document_id, filename, file_content)
+            logger.info(f"Saved original file for document {document_id}")
+        except Exception as e:
+            logger.warning(f"Failed to save original file: {e}")
+
+        # Step 1: Parsing (0-25%)
+        emit_progress(ProcessingStep.PARSING, 0, "開始解析 Excel 文件...")
+
+        sheets_data = []
+        is_xlsx = filename.lower().endswith(".xlsx")
+
+        if is_xlsx:
+            # Process .xlsx with openpyxl
+            wb = load_workbook(io.BytesIO(file_content), data_only=True)
+            sheet_names = wb.sheetnames
+            total_sheets = len(sheet_names)
+
+            for sheet_idx, sheet_name in enumerate(sheet_names):
+                ws = wb[sheet_name]
+                rows = []
+
+                for row in ws.iter_rows(values_only=True):
+                    # Convert None values to empty strings
+                    row_values = [str(cell) if cell is not None else "" for cell in row]
+                    if any(v.strip() for v in row_values):  # Skip completely empty rows
+                        rows.append(row_values)
+
+                if rows:
+                    sheets_data.append({
+                        "name": sheet_name,
+                        "rows": rows,
+                    })
+
+                # Progress: 0-20% for parsing
+                parse_progress = int((sheet_idx + 1) / total_sheets * 20)
+                emit_progress(ProcessingStep.PARSING, parse_progress, f"解析工作表 {sheet_idx + 1}/{total_sheets}: {sheet_name}...")
+
+            wb.close()
         else:
-            # Fallback: treat entire sheet as one chunk
-            if sheet_text.strip():
-                chunks.append({
-                    "content": sheet_text.strip(),
-                    "metadata": {"sheet_name": sheet_name},
-                })
-
-    emit_progress(ProcessingStep.CHUNKING, 50, f"分塊完成，共 {len(chunks)} 個文字區塊", len(chunks))
-
-    # Step 3: Embedding (50-90%)
-    emit_progress(ProcessingStep.EMBEDDING, 50, "向量化文字區塊中...")
-
-    if chunks:
-        contents = [c["content"] for c in chunks]
-        embeddings = embed_service.embed_texts(contents)
-
-        for idx, (chunk, emb) in enumerate(zip(chunks, embeddings)):
-            vector_store.add_text_chunk(
-                document_id=document_id,
-                document_name=filename,
-                content=chunk["content"],
-                embedding=emb,
-                chunk_index=idx,
-                metadata=chunk.get("metadata", {}),
-            )
-            chunk_count += 1
-
-            # Progress: 50-90% for embedding
-            if len(chunks) > 0:
-                embed_progress = 50 + int((idx + 1) / len(chunks) * 40)
-                emit_progress(ProcessingStep.EMBEDDING, embed_progress, f"向量化文字 {idx + 1}/{len(chunks)}...", chunk_count)
+            # Process .xls with xlrd
+            wb = xlrd.open_workbook(file_contents=file_content)
+            total_sheets = wb.nsheets
+
+            for sheet_idx in range(total_sheets):
+                ws = wb.sheet_by_index(sheet_idx)
+                sheet_name = ws.name
+                rows = []
+
+                for row_idx in range(ws.nrows):
+                    row_values = [str(ws.cell_value(row_idx, col_idx)) for col_idx in range(ws.ncols)]
+                    if any(v.strip() for v in row_values):  # Skip completely empty rows
+                        rows.append(row_values)
+
+                if rows:
+                    sheets_data.append({
+                        "name": sheet_name,
+                        "rows": rows,
+                    })
+
+                # Progress: 0-20% for parsing
+                parse_progress = int((sheet_idx + 1) / total_sheets * 20)
+                emit_progress(ProcessingStep.PARSING, parse_progress, f"解析工作表 {sheet_idx + 1}/{total_sheets}: {sheet_name}...")
+
+        emit_progress(ProcessingStep.PARSING, 25, f"解析完成，共 {len(sheets_data)} 個工作表")
+
+        # Step 2: Chunking (25-50%)
+        emit_progress(ProcessingStep.CHUNKING, 25, "文件分塊中...")
+
+        chunks = []
+        for sheet in sheets_data:
+            sheet_name = sheet["name"]
+            rows = sheet["rows"]
+
+            if not rows:
+                continue
+
+            # Convert rows to structured text format (markdown table style)
+            # First row is treated as header
+            header = rows[0] if rows else []
+            data_rows = rows[1:] if len(rows) > 1 else []
+
+            # Build structured text for the sheet
+            sheet_text_parts = []
+            sheet_text_parts.append(f"## 工作表: {sheet_name}\n")
+
+            if header:
+                # Create markdown table header
+                header_line = "| " + " | ".join(header) + " |"
+                separator = "| " + " | ".join(["---"] * len(header)) + " |"
+                sheet_text_parts.append(header_line)
+                sheet_text_parts.append(separator)
+
+            # Add data rows
+            for row in data_rows:
+                # Ensure row has same number of columns as header
+                padded_row = row + [""] * (len(header) - len(row)) if len(row) < len(header) else row[:len(header)]
+                row_line = "| " + " | ".join(padded_row) + " |"
+                sheet_text_parts.append(row_line)
+
+            sheet_text = "\n".join(sheet_text_parts)
+
+            # Smart chunking or fallback
+            if use_smart_chunking and sheet_text.strip():
+                sheet_chunks = smart_chunk(sheet_text, chunk_size=500, overlap=100)
+                for chunk in sheet_chunks:
+                    chunk["metadata"]["sheet_name"] = sheet_name
+                    chunks.append(chunk)
+            else:
+                # Fallback: treat entire sheet as one chunk
+                if sheet_text.strip():
+                    chunks.append({
+                        "content": sheet_text.strip(),
+                        "metadata": {"sheet_name": sheet_name},
+                    })
+
+        emit_progress(ProcessingStep.CHUNKING, 50, f"分塊完成，共 {len(chunks)} 個文字區塊", len(chunks))
+
+        # Step 3: Embedding (50-90%)
+        emit_progress(ProcessingStep.EMBEDDING, 50, "向量化文字區塊中...")
+
+        if chunks:
+            contents = [c["content"] for c in chunks]
+            embeddings = embed_service.embed_texts(contents)
+
+            for idx, (chunk, emb) in enumerate(zip(chunks, embeddings)):
+                vector_store.add_text_chunk(
+                    document_id=document_id,
+                    document_name=filename,
+                    content=chunk["content"],
+                    embedding=emb,
+                    chunk_index=idx,
+                    metadata=chunk.get("metadata", {}),
+                )
+                chunk_count += 1
+
+                # Progress: 50-90% for embedding
+                if len(chunks) > 0:
+                    embed_progress = 50 + int((idx + 1) / len(chunks) * 40)
+                    emit_progress(ProcessingStep.EMBEDDING, embed_progress, f"向量化文字 {idx + 1}/{len(chunks)}...", chunk_count)
+
+        return chunk_count
+
+    # Off the loop: openpyxl/xlrd parsing and the embedding/upsert loop
+    chunk_count = await asyncio.to_thread(_process)
 
     # Step 4: Indexing (90-100%)
     emit_progress(ProcessingStep.INDEXING, 90, "建立索引中...")
@@ -4,13 +4,16 @@ Export Service - Generate CSV/Excel exports from query results.
 
 import csv
 import io
-from typing import List, Dict, Any, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional
 from datetime import datetime
 
 
 class ExportService:
     """Service for exporting data to various formats"""
-    
+
+    # Rows per emitted chunk in to_csv_stream
+    CSV_BATCH_SIZE = 1000
+
     def to_csv(
         self,
         data: List[Dict[str, Any]],
@@ -59,6 +62,91 @@ class ExportService:
         csv_str = self.to_csv(data, columns, include_header)
         return csv_str.encode(encoding)
     
+    def to_csv_stream(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        columns: Optional[List[str]] = None,
+        include_header: bool = True,
+        encoding: str = "utf-8-sig"  # BOM for Excel compatibility
+    ) -> Iterator[bytes]:
+        """
+        Export rows to CSV as a stream of byte chunks.
+
+        Encodes CSV_BATCH_SIZE rows at a time, so peak memory stays at
+        one batch regardless of export size and the response can start
+        before the last row is formatted. The BOM (from utf-8-sig) is
+        emitted only with the first chunk.
+        """
+        row_iter = iter(rows)
+        first = next(row_iter, None)
+        if first is None:
+            return
+
+        if columns is None:
+            columns = list(first.keys())
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        if include_header:
+            writer.writerow(columns)
+
+        pending = 0
+        for row in self._chain_first(first, row_iter):
+            writer.writerow([self._format_value(row.get(col)) for col in columns])
+            pending += 1
+            if pending >= self.CSV_BATCH_SIZE:
+                yield buffer.getvalue().encode(encoding)
+                encoding = "utf-8"  # BOM only once
+                buffer.seek(0)
+                buffer.truncate(0)
+                pending = 0
+
+        if pending:
+            yield buffer.getvalue().encode(encoding)
+
+    async def to_csv_stream_async(
+        self,
+        rows: AsyncIterator[Dict[str, Any]],
+        columns: Optional[List[str]] = None,
+        include_header: bool = True,
+        encoding: str = "utf-8-sig"  # BOM for Excel compatibility
+    ) -> AsyncIterator[bytes]:
+        """
+        Async counterpart of to_csv_stream for async row iterators.
+
+        Fed by a server-side DB cursor (stream_sql), CSV encoding
+        overlaps the fetch and only one batch of rows plus one chunk of
+        text ever lives in memory.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        pending = 0
+
+        async for row in rows:
+            if columns is None:
+                columns = list(row.keys())
+            if include_header:
+                writer.writerow(columns)
+                include_header = False
+            writer.writerow([self._format_value(row.get(col)) for col in columns])
+            pending += 1
+            if pending >= self.CSV_BATCH_SIZE:
+                yield buffer.getvalue().encode(encoding)
+                encoding = "utf-8"  # BOM only once
+                buffer.seek(0)
+                buffer.truncate(0)
+                pending = 0
+
+        if pending:
+            yield buffer.getvalue().encode(encoding)
+
+    @staticmethod
+    def _chain_first(first: Dict[str, Any], rest: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Re-attach the peeked first row to the remaining iterator"""
+        yield first
+        yield from rest
+
     def _format_value(self, value: Any) -> str:
         """Format value for CSV export"""
         if value is None:
@@ -3,8 +3,10 @@ Intent Classifier Service - Determine query type and route accordingly.
 Uses LLM to classify user intent into: structured, knowledge, hybrid, or clarification.
 """
 
+import functools
 import os
 import json
+import re
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 from enum import Enum
@@ -90,13 +92,52 @@ SYSTEM_PROMPT = f"""你是一個車輛維修知識管理系統的意圖分類器
 """
 
 
+# Rule-based prefilter vocabularies. A query matching exactly one of
+# these is classified without the LLM roundtrip (200-1000ms); anything
+# matching both (e.g. "轉向架維修標準流程" or "EMU801 故障原因分析")
+# is ambiguous or hybrid and falls through to the model.
+_VEHICLE_CODE_RE = re.compile(r"(?:EMU|TEMU)\d+", re.IGNORECASE)
+_STRUCTURED_RE = re.compile(
+    r"(?:EMU|TEMU)\d+|故障|檢修|成本|庫存|里程|零件|機務段", re.IGNORECASE
+)
+_KNOWLEDGE_RE = re.compile(r"流程|標準|手冊|程序|規範|如何|怎麼|為什麼|建議|原因")
+
+
 class IntentClassifierService:
     """Service for classifying user query intent"""
-    
+
     def __init__(self):
         self.client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o")
-    
+
+    @staticmethod
+    def _prefilter(query: str) -> Optional[IntentResult]:
+        """Fast path for queries the keyword rules classify unambiguously."""
+        structured = _STRUCTURED_RE.search(query) is not None
+        knowledge = _KNOWLEDGE_RE.search(query) is not None
+        if structured == knowledge:
+            # Neither vocabulary (needs clarification?) or both (hybrid?):
+            # let the LLM decide
+            return None
+
+        if structured:
+            entities: Dict[str, Any] = {}
+            codes = _VEHICLE_CODE_RE.findall(query)
+            if codes:
+                entities["vehicle_code"] = codes[0].upper()
+            return IntentResult(
+                intent=QueryIntent.STRUCTURED,
+                confidence=0.95,
+                entities=entities,
+                reasoning="規則式分類：查詢包含結構化資料關鍵字",
+            )
+        return IntentResult(
+            intent=QueryIntent.KNOWLEDGE,
+            confidence=0.95,
+            entities={},
+            reasoning="規則式分類：查詢包含文件知識關鍵字",
+        )
+
     async def classify(self, query: str, context: Optional[str] = None) -> IntentResult:
         """
         Classify user query intent.
@@ -108,10 +149,17 @@ class IntentClassifierService:
         Returns:
             IntentResult with classification details
         """
+        # Rule-based fast path; only when there is no conversation
+        # context, which can flip the meaning of a keyword
+        if not context:
+            prefiltered = self._prefilter(query)
+            if prefiltered is not None:
+                return prefiltered
+
         user_prompt = f"使用者查詢: {query}"
         if context:
             user_prompt = f"對話脈絡: {context}\n\n{user_prompt}"
-        
+
         try:
             response = await self.client.chat.completions.create(
                 model=self.model,
@@ -152,13 +200,7 @@ class IntentClassifierService:
         return results
 
 
-# Singleton instance
-_intent_classifier = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_intent_classifier() -> IntentClassifierService:
-    """Get or create intent classifier instance"""
-    global _intent_classifier
-    if _intent_classifier is None:
-        _intent_classifier = IntentClassifierService()
-    return _intent_classifier
+    """Get or create the singleton intent classifier instance"""
+    return IntentClassifierService()
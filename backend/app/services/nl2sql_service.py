@@ -3,14 +3,19 @@ NL2SQL Service - Natural Language to SQL conversion.
 Uses LLM to convert user queries to safe SQL statements.
 """
 
+import asyncio
+import functools
+import hashlib
 import os
 import re
 import json
 from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 
 from openai import AsyncOpenAI
 
+from app.services import cache as cache_service
+
 
 @dataclass
 class SQLQuery:
@@ -100,7 +105,7 @@ TABLE_SCHEMA = """
 - cost_type: VARCHAR(50) - 成本類型 (labor/parts/external/other)
 - category: VARCHAR(50) - 成本分類
 - description: VARCHAR(500) - 費用說明
-- amount: NUMERIC(14,2) - 金額
+- amount: BIGINT - 金額，以「分」儲存；輸出金額請用 amount / 100.0
 - currency: VARCHAR(10) - 幣別 (TWD)
 """
 
@@ -125,6 +130,20 @@ ALLOWED_TABLES = {
     "parts_inventory", "parts_used", "cost_records"
 }
 
+# Conversions are deterministic for a given query/context (temperature
+# 0) and schema, so they cache well; the schema digest in the key
+# invalidates every entry when TABLE_SCHEMA changes.
+SQL_CACHE_TTL = 86400
+_SCHEMA_DIGEST = hashlib.sha256(TABLE_SCHEMA.encode("utf-8")).hexdigest()[:8]
+
+
+def _sql_cache_key(query: str, context: Optional[str]) -> str:
+    """Cache key for a NL→SQL conversion."""
+    digest = hashlib.sha256(
+        (query.strip().lower() + "\x00" + (context or "")).encode("utf-8")
+    ).hexdigest()[:16]
+    return f"nl2sql:{_SCHEMA_DIGEST}:{digest}"
+
 
 class NL2SQLService:
     """Service for converting natural language to SQL"""
@@ -172,6 +191,18 @@ If the query cannot be converted to SQL, respond with:
 }}
 """
 
+        # Repeated questions (dashboard widgets, common lookups) skip the
+        # ~500ms LLM roundtrip entirely on a cache hit
+        cache_key = _sql_cache_key(query, context)
+        client = cache_service.get_redis_client()
+        if client is not None:
+            try:
+                cached = await asyncio.to_thread(client.get, cache_key)
+            except Exception:
+                cached = None
+            if cached:
+                return SQLQuery(**json.loads(cached))
+
         user_prompt = f"Query: {query}"
         if context:
             user_prompt += f"\nContext: {context}"
@@ -211,14 +242,28 @@ If the query cannot be converted to SQL, respond with:
                     error=validation["error"]
                 )
             
-            return SQLQuery(
+            sql_query = SQLQuery(
                 sql=result["sql"],
                 query_type=result.get("query_type", "select"),
                 tables=result.get("tables", []),
                 parameters={},
                 is_valid=True
             )
-            
+
+            # Only valid conversions are cached; failures stay retryable
+            if client is not None:
+                try:
+                    await asyncio.to_thread(
+                        client.setex,
+                        cache_key,
+                        SQL_CACHE_TTL,
+                        json.dumps(asdict(sql_query)),
+                    )
+                except Exception:
+                    pass
+
+            return sql_query
+
         except Exception as e:
             return SQLQuery(
                 sql="",
@@ -283,13 +328,7 @@ If the query cannot be converted to SQL, respond with:
         return list(set(tables))
 
 
-# Singleton instance
-_nl2sql_service = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_nl2sql_service() -> NL2SQLService:
-    """Get or create NL2SQL service instance"""
-    global _nl2sql_service
-    if _nl2sql_service is None:
-        _nl2sql_service = NL2SQLService()
-    return _nl2sql_service
+    """Get or create the singleton NL2SQL service instance"""
+    return NL2SQLService()
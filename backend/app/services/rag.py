@@ -13,10 +13,19 @@ from app.services import reranker as reranker_service
 from app.services import cache as cache_service
 from app.services import file_storage
 from app.services.terminology import expand_query, RAIL_TERMINOLOGY
+from pydantic import TypeAdapter
+
 from app.models.schemas import SearchResult, ChunkType
 
 logger = logging.getLogger(__name__)
 
+# Cached list adapter: dumping a whole hit list runs in one pydantic-core
+# pass instead of one Python-level model_dump call per element.
+_RESULTS_ADAPTER = TypeAdapter(list[SearchResult])
+
+# Canned reply when retrieval returns nothing relevant
+NO_SOURCES_MESSAGE = "找不到相關的知識庫內容。請上傳相關文件後再試。"
+
 
 # 優化後的 System Prompt
 SYSTEM_PROMPT = """你是台鐵 EMU800 電聯車維修知識助手。你的任務是根據知識庫內容準確回答維修相關問題。
@@ -121,6 +130,7 @@ def hybrid_search(
     top_k: int = 5,
     use_expansion: bool = True,
     use_rerank: bool = True,
+    score_threshold: Optional[float] = None,
 ) -> list[dict]:
     """
     混合搜尋：結合向量搜尋和關鍵字搜尋，可選 Reranker
@@ -130,6 +140,7 @@ def hybrid_search(
         top_k: 返回結果數量
         use_expansion: 是否使用查詢擴展
         use_rerank: 是否使用 Cohere Reranker
+        score_threshold: 向量相似度下限，由 Qdrant 端套用
 
     Returns:
         搜尋結果列表
@@ -143,10 +154,14 @@ def hybrid_search(
     text_embedding = embed_service.embed_text(expanded_query)
     # Fetch more candidates if reranking is enabled
     fetch_k = top_k * 4 if use_rerank else top_k * 2
-    vector_results = vector_store.search_text(text_embedding, top_k=fetch_k)
+    vector_results = vector_store.search_text(
+        text_embedding, top_k=fetch_k, score_threshold=score_threshold
+    )
 
     # 2. 關鍵字搜尋（基於 BM25）
-    all_chunks = vector_store.search_text(text_embedding, top_k=100)  # 獲取更多候選
+    all_chunks = vector_store.search_text(
+        text_embedding, top_k=100, score_threshold=score_threshold
+    )  # 獲取更多候選
 
     # 計算 BM25 分數
     for chunk in all_chunks:
@@ -162,7 +177,7 @@ def hybrid_search(
 
     # 4. Rerank (if enabled and available)
     if use_rerank and reranker_service.is_reranker_available():
-        logger.debug(f"Reranking {len(fused_results)} results for query: {query[:50]}...")
+        logger.debug("Reranking %s results for query: %s...", len(fused_results), query[:50])
         reranked = reranker_service.rerank(
             query=query,  # Use original query for reranking
             documents=fused_results,
@@ -181,34 +196,47 @@ def search(
     use_hybrid: bool = True,
     use_rerank: bool = True,
     use_cache: bool = True,
+    score_threshold: Optional[float] = None,
 ) -> list[SearchResult]:
     """
     Search knowledge base with text and/or image query.
 
     Returns combined and ranked results from both text and image collections.
+    score_threshold (raw similarity, not RRF/rerank score) is enforced
+    inside Qdrant, truncating the candidate list at the source instead of
+    fetching, transferring and validating hits that would be discarded.
     """
     results = []
 
-    # Check cache first (only for text-only queries)
+    # Check cache first (only for text-only queries at the default
+    # threshold - the cache key doesn't carry the threshold)
     cache_hit = False
+    use_cache = use_cache and score_threshold is None
     if query and use_cache and not image_base64:
         cached = cache_service.get_cached_results(query, top_k)
         if cached:
             cache_hit = True
-            logger.debug(f"Cache hit for query: {query[:50]}...")
+            logger.debug("Cache hit for query: %s...", query[:50])
             # Convert cached dicts back to SearchResult
             for r in cached:
-                results.append(SearchResult(**r))
+                results.append(SearchResult.model_construct(**r))
             return results
 
     # Text search
     if query:
         if use_hybrid:
-            text_results = hybrid_search(query, top_k=top_k, use_rerank=use_rerank)
+            text_results = hybrid_search(
+                query,
+                top_k=top_k,
+                use_rerank=use_rerank,
+                score_threshold=score_threshold,
+            )
         else:
             # 原始向量搜尋
             text_embedding = embed_service.embed_text(query)
-            text_results = vector_store.search_text(text_embedding, top_k=top_k)
+            text_results = vector_store.search_text(
+                text_embedding, top_k=top_k, score_threshold=score_threshold
+            )
 
         for r in text_results:
             # Check if original file exists for preview
@@ -216,7 +244,7 @@ def search(
             file_url = f"/api/kb/documents/{doc_id}/file" if file_storage.file_exists(doc_id) else None
 
             results.append(
-                SearchResult(
+                SearchResult.model_construct(
                     id=r["id"],
                     content=r["content"],
                     doc_type=ChunkType.TEXT,
@@ -233,7 +261,9 @@ def search(
             # 擴展查詢用於圖片搜尋
             expanded_query = expand_query(query)
             clip_text_embedding = embed_service.embed_text_jina(expanded_query)
-            image_results = vector_store.search_images(clip_text_embedding, top_k=top_k)
+            image_results = vector_store.search_images(
+                clip_text_embedding, top_k=top_k, score_threshold=score_threshold
+            )
 
             for r in image_results:
                 # Check if original file exists for preview
@@ -241,7 +271,7 @@ def search(
                 file_url = f"/api/kb/documents/{doc_id}/file" if file_storage.file_exists(doc_id) else None
 
                 results.append(
-                    SearchResult(
+                    SearchResult.model_construct(
                         id=r["id"],
                         content=r.get("description", "Image"),
                         doc_type=ChunkType.IMAGE,
@@ -249,6 +279,7 @@ def search(
                         document_name=r["document_name"],
                         score=r["score"],
                         image_base64=r.get("image_base64"),
+                        image_url=f"/api/kb/chunks/{r['id']}/image",
                         file_url=file_url,
                     )
                 )
@@ -259,7 +290,9 @@ def search(
     if image_base64:
         try:
             image_embedding = embed_service.embed_image_from_base64(image_base64)
-            image_results = vector_store.search_images(image_embedding, top_k=top_k)
+            image_results = vector_store.search_images(
+                image_embedding, top_k=top_k, score_threshold=score_threshold
+            )
 
             for r in image_results:
                 if not any(res.id == r["id"] for res in results):
@@ -268,7 +301,7 @@ def search(
                     file_url = f"/api/kb/documents/{doc_id}/file" if file_storage.file_exists(doc_id) else None
 
                     results.append(
-                        SearchResult(
+                        SearchResult.model_construct(
                             id=r["id"],
                             content=r.get("description", "Image"),
                             doc_type=ChunkType.IMAGE,
@@ -276,6 +309,7 @@ def search(
                             document_name=r["document_name"],
                             score=r["score"],
                             image_base64=r.get("image_base64"),
+                            image_url=f"/api/kb/chunks/{r['id']}/image",
                             file_url=file_url,
                         )
                     )
@@ -289,7 +323,7 @@ def search(
     # Cache results (only for text-only queries)
     if query and use_cache and not image_base64 and not cache_hit:
         # Convert to dicts for caching
-        results_to_cache = [r.model_dump() for r in final_results]
+        results_to_cache = _RESULTS_ADAPTER.dump_python(final_results)
         cache_service.set_cached_results(query, top_k, results_to_cache)
 
     return final_results
@@ -305,11 +339,20 @@ def chat(
 
     Returns: (answer, sources)
     """
+    # Answer cache: identical (query, image, top_k) repeats skip the
+    # embedding, vector search and LLM completion entirely. Entries live
+    # in the query:* keyspace, so document changes invalidate them.
+    cached = cache_service.get_cached_answer(query, image_base64, top_k)
+    if cached:
+        return cached["answer"], [
+            SearchResult.model_construct(**r) for r in cached["sources"]
+        ]
+
     # Search for relevant documents
     sources = search(query, image_base64, top_k)
 
     if not sources:
-        return "找不到相關的知識庫內容。請上傳相關文件後再試。", []
+        return NO_SOURCES_MESSAGE, []
 
     # Build context from sources
     context_parts = []
@@ -357,6 +400,15 @@ def chat(
             temperature=0.5,  # 降低溫度提高準確性
         )
         answer = response.choices[0].message.content
+        cache_service.set_cached_answer(
+            query,
+            image_base64,
+            top_k,
+            answer,
+            _RESULTS_ADAPTER.dump_python(
+                sources, exclude={"__all__": {"image_base64"}}
+            ),
+        )
     except Exception as e:
         answer = f"生成回答時發生錯誤: {str(e)}"
 
@@ -374,7 +426,7 @@ def chat_stream(
     Yields: text chunks as they are generated
     """
     if not sources:
-        yield "找不到相關的知識庫內容。請上傳相關文件後再試。"
+        yield NO_SOURCES_MESSAGE
         return
 
     # Build context from sources
@@ -446,7 +498,7 @@ def chat_stream_with_metadata(
     - type='usage': token usage info (at the end)
     """
     if not sources:
-        yield {"type": "content", "data": "找不到相關的知識庫內容。請上傳相關文件後再試。"}
+        yield {"type": "content", "data": NO_SOURCES_MESSAGE}
         return
 
     # Build context from sources
@@ -565,5 +617,5 @@ AI 回答：{answer[:1000]}...
         return questions[:max_questions]
         
     except Exception as e:
-        logger.error(f"Error generating follow-up questions: {e}")
+        logger.error("Error generating follow-up questions: %s", e)
         return []
@@ -90,6 +90,50 @@ class StructuredQueryService:
         data = [self._row_to_dict(row, columns) for row in rows]
         
         return {"data": data, "columns": columns}
+
+    async def stream_sql(
+        self,
+        sql: str,
+        params: Optional[Dict] = None,
+        batch_size: int = 1000,
+    ):
+        """
+        Stream a query's rows as serialized dicts.
+
+        Uses a server-side cursor (session.stream with yield_per), so
+        only batch_size rows are held in memory at a time and downstream
+        consumers (CSV export) overlap encoding with the DB fetch,
+        instead of loading the full result set into a list first.
+        """
+        if self.session:
+            async for row in self._stream_with_session(
+                self.session, sql, params, batch_size
+            ):
+                yield row
+        else:
+            async with get_db_context() as session:
+                async for row in self._stream_with_session(
+                    session, sql, params, batch_size
+                ):
+                    yield row
+
+    async def _stream_with_session(
+        self,
+        session: AsyncSession,
+        sql: str,
+        params: Optional[Dict],
+        batch_size: int,
+    ):
+        """Stream query rows with given session"""
+        result = await session.stream(
+            text(sql),
+            params or {},
+            execution_options={"yield_per": batch_size},
+        )
+        columns = list(result.keys())
+        async for partition in result.partitions(batch_size):
+            for row in partition:
+                yield self._row_to_dict(row, columns)
     
     def _row_to_dict(self, row, columns: List[str]) -> Dict[str, Any]:
         """Convert a row to a JSON-serializable dict"""
@@ -134,6 +178,28 @@ class StructuredQueryService:
         Returns:
             QueryResult with fault records
         """
+        sql, params = self._build_vehicle_faults_sql(vehicle_code, status, fault_type, limit)
+        return await self.execute_sql(sql, params)
+
+    def stream_vehicle_faults(
+        self,
+        vehicle_code: str,
+        status: Optional[str] = None,
+        fault_type: Optional[str] = None,
+        limit: int = 100,
+        batch_size: int = 1000,
+    ):
+        """Streaming variant of get_vehicle_faults (see stream_sql)."""
+        sql, params = self._build_vehicle_faults_sql(vehicle_code, status, fault_type, limit)
+        return self.stream_sql(sql, params, batch_size=batch_size)
+
+    def _build_vehicle_faults_sql(
+        self,
+        vehicle_code: str,
+        status: Optional[str] = None,
+        fault_type: Optional[str] = None,
+        limit: int = 100,
+    ):
         sql = """
         SELECT 
             f.id,
@@ -165,7 +231,7 @@ class StructuredQueryService:
         
         sql += f" ORDER BY f.fault_date DESC LIMIT {limit}"
         
-        return await self.execute_sql(sql, params)
+        return sql, params
     
     async def get_vehicle_maintenance(
         self,
@@ -175,6 +241,28 @@ class StructuredQueryService:
         limit: int = 100
     ) -> QueryResult:
         """Get maintenance records for a specific vehicle."""
+        sql, params = self._build_vehicle_maintenance_sql(vehicle_code, status, maintenance_type, limit)
+        return await self.execute_sql(sql, params)
+
+    def stream_vehicle_maintenance(
+        self,
+        vehicle_code: str,
+        status: Optional[str] = None,
+        maintenance_type: Optional[str] = None,
+        limit: int = 100,
+        batch_size: int = 1000,
+    ):
+        """Streaming variant of get_vehicle_maintenance (see stream_sql)."""
+        sql, params = self._build_vehicle_maintenance_sql(vehicle_code, status, maintenance_type, limit)
+        return self.stream_sql(sql, params, batch_size=batch_size)
+
+    def _build_vehicle_maintenance_sql(
+        self,
+        vehicle_code: str,
+        status: Optional[str] = None,
+        maintenance_type: Optional[str] = None,
+        limit: int = 100,
+    ):
         sql = """
         SELECT 
             m.id,
@@ -208,7 +296,7 @@ class StructuredQueryService:
         
         sql += f" ORDER BY m.maintenance_date DESC LIMIT {limit}"
         
-        return await self.execute_sql(sql, params)
+        return sql, params
     
     async def get_vehicle_costs(
         self,
@@ -219,6 +307,30 @@ class StructuredQueryService:
         limit: int = 100
     ) -> QueryResult:
         """Get cost records for a specific vehicle."""
+        sql, params = self._build_vehicle_costs_sql(vehicle_code, cost_type, start_date, end_date, limit)
+        return await self.execute_sql(sql, params)
+
+    def stream_vehicle_costs(
+        self,
+        vehicle_code: str,
+        cost_type: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: int = 100,
+        batch_size: int = 1000,
+    ):
+        """Streaming variant of get_vehicle_costs (see stream_sql)."""
+        sql, params = self._build_vehicle_costs_sql(vehicle_code, cost_type, start_date, end_date, limit)
+        return self.stream_sql(sql, params, batch_size=batch_size)
+
+    def _build_vehicle_costs_sql(
+        self,
+        vehicle_code: str,
+        cost_type: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: int = 100,
+    ):
         sql = """
         SELECT 
             c.id,
@@ -226,7 +338,7 @@ class StructuredQueryService:
             c.cost_type,
             c.category,
             c.description,
-            c.amount,
+            c.amount / 100.0 AS amount,
             c.currency,
             c.vendor,
             v.vehicle_code,
@@ -252,7 +364,7 @@ class StructuredQueryService:
         
         sql += f" ORDER BY c.record_date DESC LIMIT {limit}"
         
-        return await self.execute_sql(sql, params)
+        return sql, params
     
     async def get_vehicles(
         self,
@@ -262,8 +374,33 @@ class StructuredQueryService:
         limit: int = 100
     ) -> QueryResult:
         """Get list of vehicles with optional filters."""
+        sql, params = self._build_vehicles_sql(depot, vehicle_type, status, limit)
+        return await self.execute_sql(sql, params)
+
+    def stream_vehicles(
+        self,
+        depot: Optional[str] = None,
+        vehicle_type: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+        batch_size: int = 1000,
+    ):
+        """Streaming variant of get_vehicles (see stream_sql)."""
+        sql, params = self._build_vehicles_sql(depot, vehicle_type, status, limit)
+        return self.stream_sql(sql, params, batch_size=batch_size)
+
+    def _build_vehicles_sql(
+        self,
+        depot: Optional[str] = None,
+        vehicle_type: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+    ):
+        # Join + filtered aggregate: one scan over fault_records (via
+        # idx_fault_vehicle_status_date) instead of a correlated
+        # COUNT(*) subquery per vehicle row
         sql = """
-        SELECT 
+        SELECT
             v.id,
             v.vehicle_code,
             v.vehicle_type,
@@ -272,28 +409,29 @@ class StructuredQueryService:
             v.status,
             v.depot,
             v.last_maintenance_date,
-            (SELECT COUNT(*) FROM fault_records f WHERE f.vehicle_id = v.id AND f.status = 'open') as open_faults
+            COUNT(f.id) FILTER (WHERE f.status = 'open') as open_faults
         FROM vehicles v
+        LEFT JOIN fault_records f ON f.vehicle_id = v.id
         WHERE 1=1
         """
-        
+
         params = {}
-        
+
         if depot:
             sql += " AND v.depot = :depot"
             params["depot"] = depot
-        
+
         if vehicle_type:
             sql += " AND v.vehicle_type = :vehicle_type"
             params["vehicle_type"] = vehicle_type
-        
+
         if status:
             sql += " AND v.status = :status"
             params["status"] = status
-        
-        sql += f" ORDER BY v.vehicle_code LIMIT {limit}"
-        
-        return await self.execute_sql(sql, params)
+
+        sql += f" GROUP BY v.id ORDER BY v.vehicle_code LIMIT {limit}"
+
+        return sql, params
     
     async def get_parts_inventory(
         self,
@@ -302,6 +440,26 @@ class StructuredQueryService:
         limit: int = 100
     ) -> QueryResult:
         """Get parts inventory with optional filters."""
+        sql, params = self._build_parts_inventory_sql(category, low_stock_only, limit)
+        return await self.execute_sql(sql, params)
+
+    def stream_parts_inventory(
+        self,
+        category: Optional[str] = None,
+        low_stock_only: bool = False,
+        limit: int = 100,
+        batch_size: int = 1000,
+    ):
+        """Streaming variant of get_parts_inventory (see stream_sql)."""
+        sql, params = self._build_parts_inventory_sql(category, low_stock_only, limit)
+        return self.stream_sql(sql, params, batch_size=batch_size)
+
+    def _build_parts_inventory_sql(
+        self,
+        category: Optional[str] = None,
+        low_stock_only: bool = False,
+        limit: int = 100,
+    ):
         sql = """
         SELECT 
             p.id,
@@ -313,7 +471,7 @@ class StructuredQueryService:
             p.unit_price,
             p.supplier,
             p.location,
-            CASE WHEN p.quantity_on_hand <= p.minimum_quantity THEN true ELSE false END as is_low_stock
+            p.is_low_stock
         FROM parts_inventory p
         WHERE 1=1
         """
@@ -325,11 +483,11 @@ class StructuredQueryService:
             params["category"] = category
         
         if low_stock_only:
-            sql += " AND p.quantity_on_hand <= p.minimum_quantity"
+            sql += " AND p.is_low_stock"
         
         sql += f" ORDER BY p.part_number LIMIT {limit}"
         
-        return await self.execute_sql(sql, params)
+        return sql, params
 
 
 # Factory function
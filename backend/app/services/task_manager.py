@@ -1,4 +1,5 @@
 """Task manager for document processing with Redis-backed storage."""
+import asyncio
 import json
 import logging
 import uuid
@@ -24,6 +25,40 @@ ProgressCallback = Callable[[ProgressMessage], None]
 # Active callbacks (in-memory, per-process)
 _progress_callbacks: dict[str, list[ProgressCallback]] = {}
 
+# Change subscribers for the all-tasks feed: (owning loop, event) pairs.
+# Task mutations can happen on worker threads (document processing runs
+# via to_thread), so signals are marshalled onto each subscriber's loop.
+_change_subscribers: set[tuple["asyncio.AbstractEventLoop", "asyncio.Event"]] = set()
+
+
+def subscribe_changes() -> tuple["asyncio.AbstractEventLoop", "asyncio.Event"]:
+    """Register for task-change notifications.
+
+    Must be called from the event loop that will wait on the returned
+    event. The event is set on any task create/update/delete; the
+    waiter clears it after reading a snapshot.
+    """
+    entry = (asyncio.get_running_loop(), asyncio.Event())
+    _change_subscribers.add(entry)
+    return entry
+
+
+def unsubscribe_changes(
+    entry: tuple["asyncio.AbstractEventLoop", "asyncio.Event"],
+) -> None:
+    """Remove a change subscription."""
+    _change_subscribers.discard(entry)
+
+
+def _signal_change() -> None:
+    """Wake every change subscriber (thread-safe)."""
+    for loop, event in list(_change_subscribers):
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # Subscriber's loop is gone; drop the stale entry
+            _change_subscribers.discard((loop, event))
+
 
 def _get_redis() -> Optional[redis.Redis]:
     """Get Redis client for task storage."""
@@ -37,7 +72,7 @@ def _get_redis() -> Optional[redis.Redis]:
         client.ping()
         return client
     except Exception as e:
-        logger.warning(f"Redis unavailable for task storage: {e}")
+        logger.warning("Redis unavailable for task storage: %s", e)
         return None
 
 
@@ -68,8 +103,9 @@ def create_task(
         key = f"{TASK_PREFIX}{task_id}"
         client.set(key, task.model_dump_json(), ex=TASK_TTL)
         client.sadd(ACTIVE_TASKS_KEY, task_id)
-        logger.info(f"Created task: {task_id} for {filename}")
+        logger.info("Created task: %s for %s", task_id, filename)
 
+    _signal_change()
     return task
 
 
@@ -87,7 +123,7 @@ def get_task(task_id: str) -> Optional[ProcessingTask]:
     try:
         return ProcessingTask.model_validate_json(data)
     except Exception as e:
-        logger.error(f"Invalid task data for {task_id}: {e}")
+        logger.error("Invalid task data for %s: %s", task_id, e)
         return None
 
 
@@ -140,6 +176,7 @@ def update_task(
 
     # Notify callbacks
     _notify_progress(task)
+    _signal_change()
 
     return task
 
@@ -175,6 +212,7 @@ def delete_task(task_id: str) -> bool:
     if task_id in _progress_callbacks:
         del _progress_callbacks[task_id]
 
+    _signal_change()
     return True
 
 
@@ -183,7 +221,7 @@ def register_callback(task_id: str, callback: ProgressCallback) -> None:
     if task_id not in _progress_callbacks:
         _progress_callbacks[task_id] = []
     _progress_callbacks[task_id].append(callback)
-    logger.debug(f"Registered callback for task {task_id}")
+    logger.debug("Registered callback for task %s", task_id)
 
 
 def unregister_callback(task_id: str, callback: ProgressCallback) -> None:
@@ -203,7 +241,9 @@ def _notify_progress(task: ProcessingTask) -> None:
     if not callbacks:
         return
 
-    message = ProgressMessage(
+    # Fields come straight from the tracked task; model_construct skips
+    # re-validation on this per-tick path
+    message = ProgressMessage.model_construct(
         task_id=task.id,
         status=task.status,
         step=task.step,
@@ -217,7 +257,7 @@ def _notify_progress(task: ProcessingTask) -> None:
         try:
             callback(message)
         except Exception as e:
-            logger.error(f"Callback error for task {task.id}: {e}")
+            logger.error("Callback error for task %s: %s", task.id, e)
 
 
 def _get_step_message(step: ProcessingStep, progress: int) -> str:
@@ -10,6 +10,7 @@ from qdrant_client.models import (
     PointStruct,
     Filter,
     FieldCondition,
+    MatchAny,
     MatchValue,
 )
 from sqlalchemy import select, delete
@@ -42,7 +43,7 @@ def get_client() -> QdrantClient:
 
         if qdrant_url and qdrant_url != ":memory:":
             # Use persistent Qdrant
-            logger.info(f"Connecting to Qdrant at {qdrant_url}")
+            logger.info("Connecting to Qdrant at %s", qdrant_url)
             try:
                 _client = QdrantClient(
                     url=qdrant_url,
@@ -50,7 +51,7 @@ def get_client() -> QdrantClient:
                 )
                 _ensure_collections()
             except Exception as e:
-                logger.warning(f"Failed to connect to Qdrant at {qdrant_url}: {e}")
+                logger.warning("Failed to connect to Qdrant at %s: %s", qdrant_url, e)
                 logger.info("Falling back to in-memory Qdrant")
                 _client = QdrantClient(":memory:")
                 _initialize_collections()
@@ -69,7 +70,7 @@ def _ensure_collections():
     collection_names = [c.name for c in collections]
 
     if TEXT_COLLECTION not in collection_names:
-        logger.info(f"Creating collection: {TEXT_COLLECTION}")
+        logger.info("Creating collection: %s", TEXT_COLLECTION)
         client.create_collection(
             collection_name=TEXT_COLLECTION,
             vectors_config=VectorParams(
@@ -79,7 +80,7 @@ def _ensure_collections():
         )
 
     if IMAGE_COLLECTION not in collection_names:
-        logger.info(f"Creating collection: {IMAGE_COLLECTION}")
+        logger.info("Creating collection: %s", IMAGE_COLLECTION)
         client.create_collection(
             collection_name=IMAGE_COLLECTION,
             vectors_config=VectorParams(
@@ -132,14 +133,30 @@ async def add_document(
         )
         db.add(doc)
         await db.commit()
-        logger.info(f"Document {document_id} ({filename}) saved to database")
+        logger.info("Document %s (%s) saved to database", document_id, filename)
+
+
+def _as_uuid(document_id: str) -> Optional[uuid.UUID]:
+    """Parse a client-supplied document id, returning None if malformed.
+
+    Document.id is a native uuid column; letting a malformed path/query
+    string reach bind coercion raises and surfaces as a 500, where the
+    old varchar column simply matched nothing.
+    """
+    try:
+        return uuid.UUID(document_id)
+    except (ValueError, AttributeError, TypeError):
+        return None
 
 
 async def get_document(document_id: str) -> Optional[dict]:
     """Get document by ID from PostgreSQL."""
+    doc_id = _as_uuid(document_id)
+    if doc_id is None:
+        return None
     async with get_db_context() as db:
         result = await db.execute(
-            select(Document).where(Document.id == document_id)
+            select(Document).where(Document.id == doc_id)
         )
         doc = result.scalar_one_or_none()
         return doc.to_dict() if doc else None
@@ -157,10 +174,13 @@ async def list_documents() -> list[dict]:
 
 async def delete_document(document_id: str) -> bool:
     """Delete document and its chunks."""
+    doc_id = _as_uuid(document_id)
+    if doc_id is None:
+        return False
     async with get_db_context() as db:
         # Check if document exists
         result = await db.execute(
-            select(Document).where(Document.id == document_id)
+            select(Document).where(Document.id == doc_id)
         )
         doc = result.scalar_one_or_none()
         
@@ -198,14 +218,58 @@ async def delete_document(document_id: str) -> bool:
 
         # Delete from PostgreSQL
         await db.execute(
-            delete(Document).where(Document.id == document_id)
+            delete(Document).where(Document.id == doc_id)
         )
         await db.commit()
         
-        logger.info(f"Document {document_id} deleted from database and Qdrant")
+        logger.info("Document %s deleted from database and Qdrant", document_id)
         return True
 
 
+async def delete_documents(document_ids: list[str]) -> list[str]:
+    """Delete several documents in one batch.
+
+    One MatchAny delete per collection and one SQL DELETE cover the
+    whole id list, instead of a Qdrant + Postgres round trip per
+    document. Returns the ids that actually existed and were deleted.
+    """
+    if not document_ids:
+        return []
+
+    # Drop malformed ids up front: they cannot match anything and would
+    # raise during uuid bind coercion
+    valid_ids = [d for d in document_ids if _as_uuid(d) is not None]
+    if not valid_ids:
+        return []
+
+    async with get_db_context() as db:
+        result = await db.execute(
+            select(Document.id).where(Document.id.in_(valid_ids))
+        )
+        existing = [str(doc_id) for doc_id in result.scalars()]
+
+        if not existing:
+            return []
+
+        client = get_client()
+        selector = Filter(
+            must=[
+                FieldCondition(
+                    key="document_id",
+                    match=MatchAny(any=existing),
+                )
+            ]
+        )
+        client.delete(collection_name=TEXT_COLLECTION, points_selector=selector)
+        client.delete(collection_name=IMAGE_COLLECTION, points_selector=selector)
+
+        await db.execute(delete(Document).where(Document.id.in_(existing)))
+        await db.commit()
+
+        logger.info("Deleted %s documents in batch", len(existing))
+        return existing
+
+
 def add_text_chunk(
     document_id: str,
     document_name: str,
@@ -275,17 +339,38 @@ def add_image_chunk(
     return chunk_id
 
 
+def get_image_chunk(chunk_id: str) -> Optional[dict]:
+    """Fetch a single image chunk's payload by id."""
+    client = get_client()
+
+    points = client.retrieve(
+        collection_name=IMAGE_COLLECTION,
+        ids=[chunk_id],
+        with_payload=True,
+        with_vectors=False,
+    )
+    if not points:
+        return None
+    return points[0].payload
+
+
 def search_text(
     query_embedding: list[float],
     top_k: int = 5,
+    score_threshold: Optional[float] = None,
 ) -> list[dict]:
-    """Search text chunks."""
+    """Search text chunks.
+
+    score_threshold is applied by Qdrant server-side, so below-threshold
+    candidates never cross the wire or get deserialized here.
+    """
     client = get_client()
 
     results = client.query_points(
         collection_name=TEXT_COLLECTION,
         query=query_embedding,
         limit=top_k,
+        score_threshold=score_threshold,
     )
 
     return [
@@ -301,14 +386,16 @@ def search_text(
 def search_images(
     query_embedding: list[float],
     top_k: int = 5,
+    score_threshold: Optional[float] = None,
 ) -> list[dict]:
-    """Search image chunks."""
+    """Search image chunks (see search_text for score_threshold)."""
     client = get_client()
 
     results = client.query_points(
         collection_name=IMAGE_COLLECTION,
         query=query_embedding,
         limit=top_k,
+        score_threshold=score_threshold,
     )
 
     return [
@@ -6,12 +6,14 @@ Populates test data for development and demo.
 import asyncio
 import sys
 from datetime import datetime, date, timedelta
+from decimal import Decimal
 from uuid import uuid4
 import random
 
 # Add parent directory to path for imports
 sys.path.insert(0, '/Users/nickall/Projects/ai-km-platform/backend')
 
+from app.db.bulk import copy_records
 from app.db.session import async_session_maker
 from app.models.structured import (
     Vehicle,
@@ -163,7 +165,6 @@ async def seed_maintenance_records(session, vehicle_map: dict, part_map: dict):
                         part_name=part_name,
                         quantity=qty,
                         unit_cost=unit_price,
-                        total_cost=unit_price * qty,
                     )
                     session.add(parts_used)
                     parts_used_created += 1
@@ -174,53 +175,63 @@ async def seed_maintenance_records(session, vehicle_map: dict, part_map: dict):
 
 
 async def seed_usage_records(session, vehicle_map: dict):
-    """Seed usage records"""
-    usage_created = 0
+    """Seed usage records (bulk COPY, no returned ids needed)"""
+    records = []
     for code, vehicle_id in vehicle_map.items():
         # Create 30 days of usage records
         for days_ago in range(30):
             record_date = date.today() - timedelta(days=days_ago)
-            usage = UsageRecord(
-                id=uuid4(),
-                vehicle_id=vehicle_id,
-                record_date=record_date,
-                mileage=random.randint(200, 800),
-                operating_hours=random.uniform(8, 18),
-                trips_count=random.randint(4, 12),
-                route=random.choice(["西部幹線", "東部幹線", "南迴線", "北迴線"]),
-                electricity_consumption=random.uniform(500, 2000),
-            )
-            session.add(usage)
-            usage_created += 1
-    await session.flush()
+            records.append((
+                uuid4(),
+                vehicle_id,
+                record_date,
+                random.randint(200, 800),
+                Decimal(str(round(random.uniform(8, 18), 2))),
+                random.randint(4, 12),
+                random.choice(["西部幹線", "東部幹線", "南迴線", "北迴線"]),
+                Decimal(str(round(random.uniform(500, 2000), 2))),
+            ))
+    usage_created = await copy_records(
+        session,
+        "usage_records",
+        ["id", "vehicle_id", "record_date", "mileage", "operating_hours",
+         "trips_count", "route", "electricity_consumption"],
+        records,
+    )
     print(f"✅ Created {usage_created} usage records")
 
 
 async def seed_cost_records(session, vehicle_map: dict):
-    """Seed cost records"""
-    cost_created = 0
+    """Seed cost records (bulk COPY, no returned ids needed)"""
     cost_types = ["labor", "parts", "external", "other"]
-    
+
+    records = []
     for code, vehicle_id in vehicle_map.items():
         # Create 10-20 cost records per vehicle
         for _ in range(random.randint(10, 20)):
             record_date = date.today() - timedelta(days=random.randint(1, 365))
             cost_type = random.choice(cost_types)
-            cost = CostRecord(
-                id=uuid4(),
-                vehicle_id=vehicle_id,
-                record_date=record_date,
-                cost_type=cost_type,
-                category=random.choice(FAULT_TYPES),
-                description=f"車輛 {code} {cost_type} 費用",
-                amount=random.uniform(5000, 500000),
-                reference_id=f"REF-{random.randint(10000, 99999)}",
-                vendor=random.choice(["日立", "川崎重工", "台灣鐵路工業", None]),
-                approved_by=random.choice(["林主任", "黃主任", "處長"]),
-            )
-            session.add(cost)
-            cost_created += 1
-    await session.flush()
+            records.append((
+                uuid4(),
+                vehicle_id,
+                record_date,
+                cost_type,
+                random.choice(FAULT_TYPES),
+                f"車輛 {code} {cost_type} 費用",
+                random.randint(500000, 50000000),  # 金額 (分)
+                "TWD",
+                f"REF-{random.randint(10000, 99999)}",
+                random.choice(["日立", "川崎重工", "台灣鐵路工業", None]),
+                random.choice(["林主任", "黃主任", "處長"]),
+            ))
+    cost_created = await copy_records(
+        session,
+        "cost_records",
+        ["id", "vehicle_id", "record_date", "cost_type", "category",
+         "description", "amount", "currency", "reference_id", "vendor",
+         "approved_by"],
+        records,
+    )
     print(f"✅ Created {cost_created} cost records")
 
 